@@ -10,8 +10,14 @@ import platform
 import shutil
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON load/save
+except ImportError:
+    orjson = None
+
 # Colors for terminal
 class Colors:
     RED = '\033[0;31m'
@@ -25,13 +31,17 @@ class Colors:
         """Disable colors for Windows without ANSI support"""
         cls.RED = cls.GREEN = cls.YELLOW = cls.BLUE = cls.NC = ''
 
+# Host OS, resolved once
+_SYSTEM = platform.system()
+
 # Disable colors on Windows if needed
-if platform.system() == 'Windows' and not os.environ.get('TERM'):
+if _SYSTEM == 'Windows' and not os.environ.get('TERM'):
     Colors.disable()
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get Claude Desktop config path based on OS"""
-    system = platform.system()
+    system = _SYSTEM
 
     if system == 'Darwin':  # macOS
         return Path.home() / 'Library' / 'Application Support' / 'Claude' / 'claude_desktop_config.json'
@@ -40,15 +50,22 @@ def get_config_path() -> Path:
     else:  # Linux
         return Path.home() / '.config' / 'Claude' / 'claude_desktop_config.json'
 
+@lru_cache(maxsize=1)
 def find_python() -> str:
     """Find Python executable path"""
     # Use current Python
     python_path = sys.executable
     return str(Path(python_path).resolve())
 
+def find_latest_backup(config_path: Path):
+    """Return the newest timestamped backup of config_path, or None"""
+    # Timestamps are YYYYmmdd_HHMMSS, so lexical order is chronological
+    backups = sorted(config_path.parent.glob(f"{config_path.stem}.backup.*{config_path.suffix}"))
+    return backups[-1] if backups else None
+
 def main():
     print(f"{Colors.BLUE}=== PDF MCP for vLLM Auto Installer ==={Colors.NC}")
-    print(f"Platform: {platform.system()}")
+    print(f"Platform: {_SYSTEM}")
     print()
 
     # Get project root (parent of scripts directory)
@@ -83,16 +100,21 @@ def main():
         print()
         print(f"{Colors.YELLOW}Existing config found. Backing up...{Colors.NC}")
 
-        # Backup
-        backup_name = f"{config_path.stem}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}{config_path.suffix}"
-        backup_path = config_path.parent / backup_name
-        shutil.copy(config_path, backup_path)
+        raw = config_path.read_bytes()
+
+        # Backup (skipped if the most recent backup already has identical content)
+        latest_backup = find_latest_backup(config_path)
+        if latest_backup and latest_backup.read_bytes() == raw:
+            print(f"Backup unchanged, keeping {latest_backup.name}")
+        else:
+            backup_name = f"{config_path.stem}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}{config_path.suffix}"
+            backup_path = config_path.parent / backup_name
+            shutil.copy(config_path, backup_path)
 
         # Load existing config
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = orjson.loads(raw) if orjson else json.loads(raw)
 
-        if 'pdf4vllm' in config.get('mcpServers', {}):
+        if 'pdf4vllm' in (config.get('mcpServers') or {}):
             print(f"{Colors.YELLOW}pdf4vllm already configured. Updating...{Colors.NC}")
     else:
         print()
@@ -100,14 +122,13 @@ def main():
         config = {}
 
     # Update config
-    if 'mcpServers' not in config:
-        config['mcpServers'] = {}
-
-    config['mcpServers']['pdf4vllm'] = pdf4vllm_config
+    config.setdefault('mcpServers', {})['pdf4vllm'] = pdf4vllm_config
 
     # Save config
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    if orjson:
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        config_path.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding='utf-8')
 
     print()
     print(f"{Colors.GREEN}=== Installation Complete ==={Colors.NC}")
@@ -116,16 +137,16 @@ def main():
     print()
     print(f"{Colors.YELLOW}Next steps:{Colors.NC}")
     print("1. Completely quit Claude Desktop")
-    if platform.system() == 'Darwin':
+    if _SYSTEM == 'Darwin':
         print("   (Cmd+Q)")
-    elif platform.system() == 'Windows':
+    elif _SYSTEM == 'Windows':
         print("   (Right-click tray icon → Quit)")
     print("2. Restart Claude Desktop")
     print("3. Try: \"list_pdfs in ~/Documents\"")
     print()
     print(f"{Colors.BLUE}Troubleshooting:{Colors.NC}")
 
-    system = platform.system()
+    system = _SYSTEM
     if system == 'Darwin':
         print("Logs: ~/Library/Logs/Claude/mcp-server-pdf4vllm.log")
     elif system == 'Windows':
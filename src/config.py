@@ -2,6 +2,7 @@
 PDF MCP Server configuration
 Supports presets via environment variables or config.json
 """
+import functools
 import json
 import logging
 from pathlib import Path
@@ -11,6 +12,17 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime_ns: int) -> dict:
+    """Parse config.json, memoized by (path, mtime) so repeated Config() calls skip disk I/O"""
+    raw = Path(path).read_bytes()
+    try:
+        import orjson  # Optional: faster JSON parsing
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
 class Config(BaseSettings):
     """PDF MCP Server configuration using Pydantic BaseSettings"""
 
@@ -27,6 +39,7 @@ class Config(BaseSettings):
     max_images_per_request: int = 50
     max_recursion_depth: int = 2
     max_suggested_ranges: int = 5  # Number of suggested ranges when limit exceeded
+    max_image_mb_per_request: int = 0  # Stored image stream size per request (0 = no limit)
 
     # Image processing
     max_image_dimension: int = 842  # A4 height in pixels
@@ -41,20 +54,27 @@ class Config(BaseSettings):
 
     # Text corruption detection
     corruption_threshold: float = 0.3
+    min_corruption_check_chars: int = 10  # Shorter page text skips the character-based check
 
     # Extraction mode
     default_extraction_mode: Literal["auto", "text_only", "image_only"] = "auto"
 
+    # read_pdf page cache (extracted blocks + images reused across calls; 0 = off);
+    # also bounds the file sizes of idle pdfplumber documents kept for reuse
+    page_cache_mb: int = 64
+
     def model_post_init(self, __context) -> None:
         """Load additional config from config.json if exists"""
         config_path = Path(__file__).parent.parent / "config.json"
 
-        if not config_path.exists():
+        # Single stat() both checks existence and provides the cache key
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
             return
 
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
+            config_data = _load_config_file(str(config_path), mtime_ns)
 
             # Update from file (only if not set by environment variables)
             for key, value in config_data.items():
@@ -2,6 +2,8 @@
 Content ordering utility
 Sort text, tables, and images in original document order
 """
+import heapq
+from operator import itemgetter
 from typing import List, Dict
 
 
@@ -13,6 +15,10 @@ def order_content_blocks(
     """
     Sort text regions, tables, and images by top coordinate in reading order
 
+    Each input is sorted on its own (usually already in order, so Timsort is
+    linear) and the three lanes are merged with heapq.merge. Ties keep the
+    text → table → image precedence of a single stable sort.
+
     Args:
         text_regions: Text regions excluding tables [{'top': float, 'text': str}, ...]
         tables: Table info [{'top': float, 'markdown': str}, ...]
@@ -21,44 +27,18 @@ def order_content_blocks(
     Returns:
         Sorted content blocks
     """
-    all_blocks = []
-
-    # Add text regions
-    for region in text_regions:
-        all_blocks.append({
-            'type': 'text',
-            'top': region['top'],
-            'content': region['text'],
-            'image': None
-        })
-
-    # Add tables
-    for table_info in tables:
-        all_blocks.append({
-            'type': 'table',
-            'top': table_info['top'],
-            'content': table_info['markdown'],
-            'image': None
-        })
-
-    # Add images (image_data is base64 string)
-    for img_info in images:
-        all_blocks.append({
-            'type': 'image',
-            'top': img_info['top'],
-            'content': img_info['image_data'],  # base64 string
-            'image': None
-        })
-
-    # Sort by top coordinate (top to bottom)
-    all_blocks.sort(key=lambda x: x['top'])
-
-    # Add position
-    for block in all_blocks:
-        block['position'] = block['top']
-        del block['top']  # Replace top with position
-
-    return all_blocks
+    by_top = itemgetter(0)
+
+    text_lane = sorted(((r['top'], 'text', r['text']) for r in text_regions), key=by_top)
+    table_lane = sorted(((t['top'], 'table', t['markdown']) for t in tables), key=by_top)
+    # image_data is base64 string / placeholder
+    image_lane = sorted(((i['top'], 'image', i['image_data']) for i in images), key=by_top)
+
+    # Build blocks in their final shape (position replaces top)
+    return [
+        {'type': block_type, 'content': content, 'image': None, 'position': top}
+        for top, block_type, content in heapq.merge(text_lane, table_lane, image_lane, key=by_top)
+    ]
 
 
 def merge_adjacent_text_blocks(blocks: List[Dict]) -> List[Dict]:
@@ -3,10 +3,27 @@ Filename similarity matching utility
 Suggest similar files when a non-existent file is requested
 """
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 import difflib
+import functools
+import heapq
+import os
 import re
 import unicodedata
+from operator import itemgetter
+
+try:
+    from rapidfuzz import fuzz, process  # Optional: native fuzzy matching
+except ImportError:
+    fuzz = process = None
+
+# Hangul words, English words, or digit runs (applied to NFC-normalized lowercase names)
+_KEYWORD_RE = re.compile(r'[가-힣]+|[a-z]+|\d+')
+
+
+def _is_pdf_name(name: str) -> bool:
+    """Check for the .pdf extension in any letter case (x.pdf, x.PDF, x.Pdf)"""
+    return name[-4:].lower() == '.pdf'
 
 
 def normalize_filename(name: str) -> str:
@@ -26,23 +43,89 @@ def extract_keywords(filename: str) -> List[str]:
     Returns:
         List of keywords
     """
-    keywords = []
+    # Single pass over the NFC-normalized, lowercased name (macOS uses NFD filenames)
+    return _KEYWORD_RE.findall(normalize_filename(filename))
 
-    # Extract Hangul words (consecutive Hangul characters)
-    # NFC normalize for macOS NFD filenames (applies to all composed characters)
-    normalized = unicodedata.normalize('NFC', filename)
-    hangul = re.findall(r'[가-힣]+', normalized)
-    keywords.extend(hangul)
 
-    # Extract English words (consecutive English characters)
-    english = re.findall(r'[a-z]+', normalize_filename(filename))
-    keywords.extend(english)
+def _scan_pdfs(root: str, depth: int = 1) -> Iterator[Path]:
+    """
+    Yield PDF files in root and up to `depth` levels of subdirectories
 
-    # Extract numbers (consecutive digits)
-    numbers = re.findall(r'\d+', filename)
-    keywords.extend(numbers)
+    Uses os.scandir so file/dir checks come from cached DirEntry types
+    instead of a stat() per entry. Files in a directory are yielded
+    before descending into its subdirectories.
 
-    return keywords
+    Args:
+        root: Directory to scan
+        depth: Number of subdirectory levels to descend (0 = root only)
+
+    Returns:
+        Iterator of PDF file paths
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if _is_pdf_name(entry.name) and entry.is_file():
+                        yield Path(entry.path)
+                    elif depth > 0 and entry.is_dir():
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from _scan_pdfs(subdir, depth - 1)
+
+
+@functools.lru_cache(maxsize=32)
+def _candidate_search_dirs(parent: str, cwd: str) -> Tuple[Tuple[Path, bool], ...]:
+    """
+    Directories that may be searched for similar PDFs (memoized per parent/cwd)
+
+    Only the path arithmetic is memoized: whether a directory exists is
+    checked by _resolve_search_dirs on every call.
+
+    Args:
+        parent: Parent directory of the requested path (as given)
+        cwd: Current working directory
+
+    Returns:
+        Tuple of (directory, must_exist) in priority order
+    """
+    cwd_path = Path(cwd)
+    candidates = []
+
+    # 1. Directory of the requested path
+    if Path(parent) != Path('.'):
+        candidates.append((cwd_path / parent, True))
+
+    # 2. Current directory
+    candidates.append((cwd_path, False))
+
+    # 3. sample_pdfs directory (default search)
+    candidates.append((cwd_path / "sample_pdfs", True))
+
+    return tuple(candidates)
+
+
+def _resolve_search_dirs(parent: str, cwd: str) -> Tuple[Path, ...]:
+    """
+    Resolve the directories searched for similar PDFs
+
+    Args:
+        parent: Parent directory of the requested path (as given)
+        cwd: Current working directory
+
+    Returns:
+        Tuple of existing directories to search, in priority order
+    """
+    return tuple(
+        directory for directory, must_exist in _candidate_search_dirs(parent, cwd)
+        if not must_exist or directory.is_dir()
+    )
 
 
 def find_similar_pdfs(
@@ -57,8 +140,8 @@ def find_similar_pdfs(
     1. Extract keywords from request path
     2. Search PDFs in directories
     3. First filter by keyword inclusion
-    4. Second sort by filename similarity (difflib)
-    5. Return top N matches
+    4. Second sort by filename similarity (rapidfuzz if installed, else difflib)
+    5. Return top N matches (bounded selection, single pass)
 
     Args:
         requested_path: Requested file path
@@ -75,90 +158,80 @@ def find_similar_pdfs(
     keywords = extract_keywords(requested_name)
 
     # Directories to search
-    search_dirs = []
-
-    # 1. Directory of the requested path
-    if requested.parent != Path('.'):
-        parent_dir = Path.cwd() / requested.parent
-        if parent_dir.exists() and parent_dir.is_dir():
-            search_dirs.append(parent_dir)
-
-    # 2. Current directory
-    search_dirs.append(Path.cwd())
-
-    # 3. sample_pdfs directory (default search)
-    sample_dir = Path.cwd() / "sample_pdfs"
-    if sample_dir.exists() and sample_dir.is_dir():
-        search_dirs.append(sample_dir)
+    cwd = Path.cwd()
+    search_dirs = _resolve_search_dirs(str(requested.parent), str(cwd))
 
     # Collect PDF files
     all_pdfs = []
     seen_paths = set()
 
     for search_dir in search_dirs:
-        try:
-            # Search directory and 1 level down only
-            for pdf_path in search_dir.glob("*.pdf"):
-                if pdf_path.is_file() and str(pdf_path) not in seen_paths:
-                    all_pdfs.append(pdf_path)
-                    seen_paths.add(str(pdf_path))
-
-            # 1 level subdirectories
-            for pdf_path in search_dir.glob("*/*.pdf"):
-                if pdf_path.is_file() and str(pdf_path) not in seen_paths:
-                    all_pdfs.append(pdf_path)
-                    seen_paths.add(str(pdf_path))
-        except Exception:
-            continue
+        # Search directory and 1 level down only
+        for pdf_path in _scan_pdfs(str(search_dir), depth=1):
+            if str(pdf_path) not in seen_paths:
+                all_pdfs.append(pdf_path)
+                seen_paths.add(str(pdf_path))
 
     if not all_pdfs:
         return []
 
-    # First filter: keyword inclusion
+    # First filter: keyword inclusion (one alternation regex instead of N substring scans)
     keyword_matches = []
-    for pdf_path in all_pdfs:
-        pdf_name_normalized = normalize_filename(pdf_path.stem)
-        # If any keyword is included (keywords already normalized)
-        if any(kw in pdf_name_normalized for kw in keywords if len(kw) >= 2):
-            keyword_matches.append(pdf_path)
+    long_keywords = [kw for kw in keywords if len(kw) >= 2]
+    if long_keywords:
+        # Keywords are already normalized
+        keyword_re = re.compile('|'.join(map(re.escape, long_keywords)))
+        keyword_matches = [
+            pdf_path for pdf_path in all_pdfs
+            if keyword_re.search(normalize_filename(pdf_path.stem))
+        ]
 
     # Use keyword matches if available, otherwise search all
     candidates = keyword_matches if keyword_matches else all_pdfs
 
     # Second sort: similarity (NFC normalized for cross-platform)
+    target = normalize_filename(requested.name)  # Match with full filename
     pdf_names = [normalize_filename(pdf.name) for pdf in candidates]
 
-    matches = difflib.get_close_matches(
-        normalize_filename(requested.name),  # Match with full filename
-        pdf_names,
-        n=max_suggestions * 2,  # Find more than needed
-        cutoff=cutoff
-    )
-
-    if not matches:
-        return []
-
-    # Find actual paths of matched files
+    # Bounded top-N selection in a single pass (no oversampling or second lookup walk)
+    if process is not None:
+        results = process.extract(
+            target,
+            pdf_names,
+            scorer=fuzz.ratio,
+            limit=max_suggestions,
+            score_cutoff=cutoff * 100
+        )
+        top_indices = [idx for _name, _score, idx in results]
+    else:
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(target)  # difflib caches details about seq2
+
+        def scored():
+            # Same cutoff cascade as difflib.get_close_matches: the cheap upper
+            # bounds reject most names before the full ratio() is computed
+            for idx, name in enumerate(pdf_names):
+                matcher.set_seq1(name)
+                if (matcher.real_quick_ratio() >= cutoff
+                        and matcher.quick_ratio() >= cutoff):
+                    ratio = matcher.ratio()
+                    if ratio >= cutoff:
+                        yield ratio, idx
+
+        top_indices = [
+            idx for _ratio, idx in heapq.nlargest(max_suggestions, scored(), key=itemgetter(0))
+        ]
+
+    # Relative paths from current directory
     similar_files = []
-    seen_paths = set()  # Remove duplicates
+    for idx in top_indices:
+        pdf_path = candidates[idx]
+        try:
+            similar_files.append(str(pdf_path.relative_to(cwd)))
+        except ValueError:
+            similar_files.append(str(pdf_path))
 
-    for match in matches:
-        for pdf_path in all_pdfs:
-            if normalize_filename(pdf_path.name) == match:
-                # Relative path from current directory
-                try:
-                    relative = pdf_path.relative_to(Path.cwd())
-                    path_str = str(relative)
-                except ValueError:
-                    path_str = str(pdf_path)
-
-                # Remove duplicates
-                if path_str not in seen_paths:
-                    similar_files.append(path_str)
-                    seen_paths.add(path_str)
-                break
-
-    return similar_files[:max_suggestions]
+    return similar_files
 
 
 def get_file_not_found_message(
@@ -2,11 +2,101 @@
 Image processing utilities for PDF MCP server
 Simplified algorithm: configurable filtering + maximum size limit
 """
-from PIL import Image
 import io
+import struct
 from typing import Tuple, Optional
 from .config import config
 
+try:
+    import pyvips  # Optional: libvips threaded/SIMD resize pipeline
+except (ImportError, OSError):  # OSError: binding present but libvips missing
+    pyvips = None
+
+# JPEG start-of-frame markers carrying image dimensions (excludes DHT/JPG/DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _peek_dims(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from the image header without decoding
+
+    Supports PNG, JPEG, and GIF. Returns None for other formats or
+    truncated/malformed headers so callers can fall back to PIL.
+
+    Args:
+        data: Encoded image bytes
+
+    Returns:
+        Tuple of (width, height) or None if not determinable
+    """
+    try:
+        # PNG: 8-byte signature, then IHDR chunk with big-endian width/height
+        if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR':
+            return struct.unpack('>II', data[16:24])
+
+        # GIF: logical screen width/height, little-endian
+        if data[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', data[6:10])
+
+        # JPEG: walk marker segments until a SOF marker
+        if data[:2] == b'\xff\xd8':
+            pos = 2
+            size = len(data)
+            while pos + 4 <= size:
+                if data[pos] != 0xFF:
+                    return None
+                marker = data[pos + 1]
+                if marker == 0xFF:  # Fill byte
+                    pos += 1
+                    continue
+                if marker in _JPEG_SOF_MARKERS:
+                    height, width = struct.unpack('>HH', data[pos + 5:pos + 9])
+                    return width, height
+                segment_length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+                pos += 2 + segment_length
+    except struct.error:
+        return None
+
+    return None
+
+
+def _resize_with_vips(
+    image_bytes: bytes,
+    max_dimension: int,
+    img_format: Optional[str]
+) -> Optional[Tuple[bytes, int, int]]:
+    """
+    Downscale with libvips (shrink-on-load + vectorized resampling)
+
+    Only JPEG and PNG sources are handled, and they are re-encoded in their
+    own format; anything else is left to PIL, which also keeps the source
+    format, so both backends return the same image format.
+
+    Args:
+        image_bytes: Original image as bytes
+        max_dimension: Maximum width or height
+        img_format: PIL format name of the source image ('JPEG', 'PNG', ...)
+
+    Returns:
+        Tuple of (scaled_image_bytes, new_width, new_height)
+        or None if pyvips is unavailable, the format is not handled or libvips
+        fails (caller falls back to PIL)
+    """
+    if pyvips is None or img_format not in ('JPEG', 'PNG'):
+        return None
+
+    try:
+        thumb = pyvips.Image.thumbnail_buffer(
+            image_bytes, max_dimension, height=max_dimension, size='down'
+        )
+        if img_format == 'JPEG':
+            data = thumb.write_to_buffer('.jpg', Q=config.jpeg_quality)
+        else:
+            data = thumb.write_to_buffer('.png')
+        return data, thumb.width, thumb.height
+    except pyvips.Error:
+        return None
+
 
 def crop_image_to_max_dimension(
     image_bytes: bytes,
@@ -17,9 +107,10 @@ def crop_image_to_max_dimension(
 
     Algorithm:
     1. If either dimension < config.min_image_dimension → discard (return None)
+       (checked from the header bytes first, so tiny images skip PIL entirely)
     2. Scale down large images only (maintain aspect ratio)
     3. Keep small images as is
-    4. LANCZOS resampling (high quality)
+    4. LANCZOS resampling (high quality), via libvips when pyvips is installed
 
     Args:
         image_bytes: Original image as bytes
@@ -34,10 +125,20 @@ def crop_image_to_max_dimension(
         max_dimension = config.max_image_dimension
     min_dim = config.min_image_dimension
 
+    # Reject tiny images from the header alone (no PIL object needed)
+    dims = _peek_dims(image_bytes)
+    if dims is not None and (dims[0] < min_dim or dims[1] < min_dim):
+        return None, dims[0], dims[1]
+
+    from PIL import Image  # Deferred: only needed once an image is actually decoded
+
+    # Dimensions from the first (and only) PIL open, reused by the fallback below
+    size = None
+
     try:
         # Load image
         img = Image.open(io.BytesIO(image_bytes))
-        width, height = img.size
+        width, height = size = img.size
 
         # Discard if either dimension is below minimum
         if width < min_dim or height < min_dim:
@@ -47,23 +148,38 @@ def crop_image_to_max_dimension(
         if width <= max_dimension and height <= max_dimension:
             return image_bytes, width, height
 
+        # Prefer libvips for the resize when available
+        vips_result = _resize_with_vips(image_bytes, max_dimension, img.format)
+        if vips_result is not None:
+            img.close()
+            return vips_result
+
         # Scale down large images only (maintain aspect ratio)
         scale = min(max_dimension / width, max_dimension / height)
         new_width = int(width * scale)
         new_height = int(height * scale)
 
-        # LANCZOS resampling (high quality downscaling)
-        img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Large JPEG downscale: let libjpeg decode at 1/2, 1/4 or 1/8 scale (DCT domain),
+        # keeping 2x headroom over the target so LANCZOS still has detail to work with
+        if img.format == 'JPEG' and scale < 0.5:
+            img.draft(img.mode, (new_width * 2, new_height * 2))
+
+        # LANCZOS resampling (high quality downscaling), pre-reduced with a BOX filter
+        img_resized = img.resize(
+            (new_width, new_height),
+            Image.Resampling.LANCZOS,
+            reducing_gap=3.0
+        )
 
-        # Convert back to bytes
+        # Convert back to bytes (skip extra optimization passes)
         output = io.BytesIO()
         img_format = img.format or 'PNG'
 
         # Save with quality from config
         if img_format.upper() in ['JPEG', 'JPG']:
-            img_resized.save(output, format='JPEG', quality=config.jpeg_quality)
+            img_resized.save(output, format='JPEG', quality=config.jpeg_quality, optimize=False)
         else:
-            img_resized.save(output, format=img_format)
+            img_resized.save(output, format=img_format, optimize=False)
 
         # Close images to free resources
         img.close()
@@ -72,17 +188,14 @@ def crop_image_to_max_dimension(
         return output.getvalue(), new_width, new_height
 
     except Exception:
-        # Return original if processing fails
-        min_dim = config.min_image_dimension
-        try:
-            img = Image.open(io.BytesIO(image_bytes))
-            width, height = img.size
-            # Check size
-            if width < min_dim or height < min_dim:
-                return None, width, height
-            return image_bytes, width, height
-        except Exception:
-            return None, 0, 0
+        # Return original if resizing fails (without decoding the image a second time)
+        if size is None:
+            # PIL could not open the image at all
+            return None, *(dims or (0, 0))
+        width, height = size
+        if width < min_dim or height < min_dim:
+            return None, width, height
+        return image_bytes, width, height
 
 
 def is_header_footer_image(img_data: dict) -> bool:
@@ -109,12 +222,13 @@ def is_header_footer_image(img_data: dict) -> bool:
             return True
 
         # 2. Extreme aspect ratio filter (configurable, 0=disabled)
-        if config.max_aspect_ratio > 0 and width > 0 and height > 0:
-            aspect_ratio = max(width / height, height / width)
-            if aspect_ratio > config.max_aspect_ratio:
-                return True  # Consider as dividing line if > 15:1
-
-        return False
+        # Cross-multiplied form of max(w/h, h/w) > ratio (no float divisions)
+        # Consider as dividing line if > 15:1
+        max_ratio = config.max_aspect_ratio
+        return (
+            max_ratio > 0 and width > 0 and height > 0
+            and (width > height * max_ratio or height > width * max_ratio)
+        )
 
     except Exception:
         return False
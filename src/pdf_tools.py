@@ -3,21 +3,27 @@ PDF tool handlers for MCP server
 Implements list_pdfs and read_pdf tools with intelligent limits
 
 Backend: pdfplumber (text/tables) + pypdfium2 (page rendering) + pikepdf (image extraction)
+Backends are imported inside the handlers so MCP server start-up does not pay for them.
 """
-import pdfplumber
-import pikepdf
-import pypdfium2 as pdfium
-from PIL import Image
+import asyncio
+import base64
+import contextlib
 import fnmatch
+import functools
 import unicodedata
 import io
 import logging
 import os
 import re
 import shutil
-import subprocess
+import stat
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Union
 
 from src.config import config
 from .schemas import (
@@ -28,16 +34,150 @@ from .schemas import (
 )
 from .validators import validate_pdf_read_request
 from .image_processor import crop_image_to_max_dimension, is_header_footer_image
-from .file_matcher import find_similar_pdfs, get_file_not_found_message
-from .text_validator import is_text_corrupted, check_pdf_corruption_with_pdfminer
+from .file_matcher import find_similar_pdfs, get_file_not_found_message, _is_pdf_name
+from .text_validator import is_text_corrupted, check_pdf_corruption_with_pdfminer, CORRUPTION_SAMPLE_CHARS
 from .table_converter import convert_table_to_markdown
 from .content_orderer import order_content_blocks, merge_adjacent_text_blocks
 from .text_extractor import extract_non_table_text_regions
 
+try:
+    import orjson  # Optional: faster serialization of large responses
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64  # Optional: SIMD base64 for image payloads
+except ImportError:
+    pybase64 = None
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads post-processing rendered page images
+MAX_PAGE_IMAGE_WORKERS = 8
+
+# Page number separators like "- 2 -", "- 10 -"
+_PAGE_NUM_RE = re.compile(r'^-\s*\d+\s*-$')
+
+# pdfgrep -n -H output line: "file.pdf:page:text"
+_GREP_LINE_RE = re.compile(r'^(.+?\.pdf):(\d+):(.*)$', re.IGNORECASE)
+
+# Longest pdfgrep output line read (PDF text lines can be very long without breaks);
+# longer lines are skipped
+GREP_LINE_LIMIT = 1024 * 1024
+GREP_READ_CHUNK = 64 * 1024  # Bytes per read from pdfgrep's stdout
+
+# pdfgrep results per (file, mtime, size, command line), least recently used first
+GREP_CACHE_SIZE = 512
+_grep_cache: "OrderedDict[tuple, tuple[int, str, str]]" = OrderedDict()
+
+# Extracted read_pdf pages (blocks + image bytes) per file version, page and options,
+# least recently used first; bounded by config.page_cache_mb
+_page_cache: "OrderedDict[tuple, tuple[dict, int]]" = OrderedDict()
+_page_cache_bytes = 0
+
+# Idle pdfplumber documents per file version (path, mtime, size), least recently
+# used first; a worker borrows one exclusively (pdfplumber is not thread-safe).
+# Bounded by count and by the file sizes of the idle documents (an open document
+# holds at least its file's bytes), which share the config.page_cache_mb budget
+PLUMBER_POOL_SIZE = 8
+_plumber_pool: "OrderedDict[tuple, list]" = OrderedDict()
+_plumber_pool_lock = threading.Lock()
+
+# list_pdfs directory listings per (root, max_depth): ((directory, mtime_ns) of
+# every scanned directory, sorted PDF paths), least recently used first
+LISTING_CACHE_SIZE = 64
+LISTING_MTIME_MARGIN_NS = 2_000_000_000  # Covers coarse filesystem timestamps (FAT: 2 s)
+_listing_cache: "OrderedDict[tuple, tuple[tuple, list[str]]]" = OrderedDict()
+_listing_cache_lock = threading.Lock()  # Listings run on worker threads
 
-def validate_path_security(path: Path, allowed_base: Path) -> bool:
+# list_pdfs page counts per file version (path, mtime, size), least recently used first
+PAGE_COUNT_CACHE_SIZE = 1024
+_page_count_cache: "OrderedDict[tuple, int]" = OrderedDict()
+
+# Directories grep_pdf never descends into (besides hidden ones like .git)
+_GREP_SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'site-packages'})
+
+
+def _dump_json(model, exclude_none: bool = False) -> str:
+    """
+    Serialize a response model as indented JSON (orjson when installed)
+
+    Args:
+        model: Pydantic response model
+        exclude_none: Drop None fields
+
+    Returns:
+        JSON string, identical to model_dump_json(indent=2)
+    """
+    if orjson is not None:
+        return orjson.dumps(model.model_dump(exclude_none=exclude_none), option=orjson.OPT_INDENT_2).decode()
+    return model.model_dump_json(indent=2, exclude_none=exclude_none)
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64-encode image bytes as str (pybase64 when installed)"""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode('ascii')
+
+
+def _encode_page_image(page_img, filter_header_footer: bool, max_dim: int) -> tuple[bytes, str, int, int]:
+    """
+    White-out header/footer, downscale and JPEG-encode a rendered page image
+
+    Runs on a worker thread; Pillow releases the GIL while resizing/encoding.
+    The base64 form sent to the client is produced here too, off the event loop.
+
+    Args:
+        page_img: Rendered page as PIL image
+        filter_header_footer: White-out header/footer bands
+        max_dim: Maximum width or height
+
+    Returns:
+        Tuple of (jpeg_bytes, jpeg_base64, width, height)
+    """
+    from PIL import Image
+
+    # White-out header/footer if filter enabled (for image_only mode)
+    # (paste with a solid color is a C-level fill; boxes match the inclusive ImageDraw rectangles)
+    if filter_header_footer:
+        width, height = page_img.size
+        # Header: top 6% of page
+        header_height = int(height * config.header_footer_ratio)
+        page_img.paste('white', (0, 0, width, header_height + 1))
+        # Footer: bottom 6% of page
+        footer_start = int(height * config.footer_start_ratio)
+        page_img.paste('white', (0, footer_start, width, height))
+
+    # Resize page image to fit within max_image_dimension
+    # (normally a no-op: pages are rendered at the final scale; guards against rounding)
+    width, height = page_img.size
+    if width > max_dim or height > max_dim:
+        scale = min(max_dim / width, max_dim / height)
+        new_width = int(width * scale)
+        new_height = int(height * scale)
+        page_img = page_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+    # Convert to RGB if necessary (JPEG doesn't support RGBA; RGBX renders pass through)
+    if page_img.mode in ('RGBA', 'LA', 'P'):
+        page_img = page_img.convert('RGB')
+
+    buffered = io.BytesIO()
+    # 4:2:0 chroma subsampling, no Huffman optimization pass: page previews favour encode speed
+    page_img.save(
+        buffered,
+        format="JPEG",
+        quality=config.jpeg_quality,
+        subsampling=2,
+        optimize=False,
+        progressive=False
+    )
+
+    image_bytes = buffered.getvalue()
+    return image_bytes, _b64encode(image_bytes), page_img.width, page_img.height
+
+
+def validate_path_security(path: Path, allowed_base: Path, resolved: bool = False) -> bool:
     """
     Validate that a path is within the allowed base directory.
     Prevents path traversal attacks.
@@ -45,14 +185,15 @@ def validate_path_security(path: Path, allowed_base: Path) -> bool:
     Args:
         path: Path to validate
         allowed_base: Base directory that path must be within
+        resolved: Both paths are already resolved (skips the per-component stat walk)
 
     Returns:
         True if path is safe, False if potential path traversal
     """
     try:
         # Resolve both paths to eliminate symlinks and .. components
-        resolved_path = path.resolve()
-        resolved_base = allowed_base.resolve()
+        resolved_path = path if resolved else path.resolve()
+        resolved_base = allowed_base if resolved else allowed_base.resolve()
 
         # Check if the resolved path starts with the resolved base
         return resolved_path.is_relative_to(resolved_base)
@@ -60,6 +201,179 @@ def validate_path_security(path: Path, allowed_base: Path) -> bool:
         return False
 
 
+def _walk_pdf_files(
+    root: str,
+    max_depth: Optional[int],
+    name_filter: Optional[Callable[[str], bool]] = None,
+    depth: int = 0,
+    skip_dirs: Optional[frozenset] = None,
+    dir_mtimes: Optional[list] = None
+) -> Iterator[str]:
+    """
+    Yield PDF files under root using os.scandir
+
+    File/dir checks come from cached DirEntry types, the name filter runs
+    before any stat, and directories deeper than max_depth are pruned
+    instead of being walked and filtered afterwards.
+
+    Args:
+        root: Directory to scan
+        max_depth: Subdirectory levels to descend (0 = root only, None = unlimited)
+        name_filter: Optional predicate on the file name
+        depth: Current depth (internal)
+        skip_dirs: Prune hidden directories and these directory names (None = walk all)
+        dir_mtimes: If given, (directory, st_mtime_ns) of every scanned directory is appended
+
+    Returns:
+        Iterator of PDF file paths as strings (unsorted; see _path_sort_key)
+    """
+    if dir_mtimes is not None:
+        # Taken before scanning: a change during the scan shows up as a newer mtime
+        dir_mtimes.append((root, os.stat(root).st_mtime_ns))
+
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                if (
+                    _is_pdf_name(entry.name)
+                    and (name_filter is None or name_filter(entry.name))
+                    and entry.is_file()
+                ):
+                    yield entry.path
+                # Directories named like PDFs ("scans.pdf/") are descended too
+                elif (max_depth is None or depth < max_depth) and entry.is_dir(follow_symlinks=False):
+                    if skip_dirs is not None and (entry.name.startswith('.') or entry.name in skip_dirs):
+                        continue
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+
+    for subdir in subdirs:
+        try:
+            yield from _walk_pdf_files(subdir, max_depth, name_filter, depth + 1, skip_dirs, dir_mtimes)
+        except OSError as e:
+            logger.debug(f"Could not list directory {subdir}: {e}")
+
+
+def _path_sort_key(path: str) -> list[str]:
+    """Sort key giving path strings the same order as sorting Path objects (by component)"""
+    return os.path.normcase(path).split(os.sep)
+
+
+def _list_pdf_paths(root: str, max_depth: Optional[int]) -> list[str]:
+    """
+    Sorted PDF paths under root, reused while no scanned directory has changed
+
+    Adding, removing or renaming a file bumps its directory's mtime, so one
+    stat per directory validates a cached listing instead of a rescan.
+    Runs on worker threads.
+
+    Args:
+        root: Directory to scan
+        max_depth: Subdirectory levels to descend (0 = root only, None = unlimited)
+
+    Returns:
+        Sorted PDF file paths (shared with the cache: do not modify)
+    """
+    key = (root, max_depth)
+    with _listing_cache_lock:
+        cached = _listing_cache.get(key)
+
+    if cached is not None:
+        dir_mtimes, paths = cached
+        try:
+            unchanged = all(os.stat(d).st_mtime_ns == mtime_ns for d, mtime_ns in dir_mtimes)
+        except OSError:
+            unchanged = False
+        if unchanged:
+            with _listing_cache_lock:
+                if key in _listing_cache:
+                    _listing_cache.move_to_end(key)
+            return paths
+
+    dir_mtimes = []
+    scan_started_ns = time.time_ns()
+    paths = sorted(_walk_pdf_files(root, max_depth, dir_mtimes=dir_mtimes), key=_path_sort_key)
+
+    # A directory modified just before the scan may change again within the same
+    # (coarse) mtime tick without its mtime moving: such listings are not cached
+    if any(mtime_ns >= scan_started_ns - LISTING_MTIME_MARGIN_NS for _, mtime_ns in dir_mtimes):
+        return paths
+
+    with _listing_cache_lock:
+        _listing_cache[key] = (tuple(dir_mtimes), paths)
+        _listing_cache.move_to_end(key)
+        if len(_listing_cache) > LISTING_CACHE_SIZE:
+            _listing_cache.popitem(last=False)  # Evict least recently used
+    return paths
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_name_pattern(name_pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a list_pdfs name_pattern (case-insensitive glob) to a regex
+
+    Names are matched with .match() on the lowercased, NFC-normalized name,
+    the same result as fnmatch.fnmatch without its per-call normcase.
+
+    Args:
+        name_pattern: Glob pattern like "sample*" or "*[0-9].pdf"
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(fnmatch.translate(unicodedata.normalize('NFC', name_pattern.lower())))
+
+
+def _count_pages(pdf_path: Union[str, Path]) -> int:
+    """
+    Get the page count of a PDF with pypdfium2
+
+    pdfium loads pages lazily, so this reads the xref and page tree count only
+    (about 10x cheaper than a pikepdf open, which parses the whole xref up front).
+
+    Args:
+        pdf_path: PDF file path
+
+    Returns:
+        Number of pages
+    """
+    import pypdfium2 as pdfium
+
+    pdf_doc = pdfium.PdfDocument(str(pdf_path))
+    try:
+        return len(pdf_doc)
+    finally:
+        pdf_doc.close()  # Also on failure, so unreadable files don't keep handles open
+
+
+def _count_pages_cached(pdf_path: str) -> int:
+    """
+    _count_pages, cached per file version so repeated listings skip pdfium
+
+    Only called from the event loop thread (like _count_pages itself).
+
+    Args:
+        pdf_path: PDF file path
+
+    Returns:
+        Number of pages
+    """
+    st = os.stat(pdf_path)
+    key = (pdf_path, st.st_mtime_ns, st.st_size)
+    total_pages = _page_count_cache.get(key)
+    if total_pages is not None:
+        _page_count_cache.move_to_end(key)
+        return total_pages
+
+    total_pages = _count_pages(pdf_path)
+    _page_count_cache[key] = total_pages
+    if len(_page_count_cache) > PAGE_COUNT_CACHE_SIZE:
+        _page_count_cache.popitem(last=False)  # Evict least recently used
+    return total_pages
+
+
 async def list_pdfs_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
     """
     List all PDF files recursively from working directory
@@ -76,16 +390,16 @@ async def list_pdfs_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]
 
         # Resolve working directory
         working_dir = Path(input_data.working_directory)
+        current_dir = Path.cwd()  # Looked up once per request
 
         # If not absolute path, use current directory as base
         if not working_dir.is_absolute():
-            working_dir = Path.cwd() / working_dir
+            working_dir = current_dir / working_dir
 
         working_dir = working_dir.resolve()
 
         if not working_dir.exists():
             # List all subdirectories of the current directory
-            current_dir = Path.cwd()
             subdirs = []
 
             # Direct subdirectories of the current directory
@@ -106,49 +420,53 @@ async def list_pdfs_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]
                 msg = f"Working directory not found: {working_dir}"
 
             error = ListPDFsError(error="DIRECTORY_NOT_FOUND", message=msg)
-            return error.model_dump_json(indent=2), []
+            return _dump_json(error), []
 
         if not working_dir.is_dir():
             error = ListPDFsError(
                 error="NOT_A_DIRECTORY",
                 message=f"Path is not a directory: {working_dir}"
             )
-            return error.model_dump_json(indent=2), []
+            return _dump_json(error), []
 
         # Find PDF files
         pdfs = []
-        pattern = "**/*.pdf" if input_data.recursive else "*.pdf"
-        max_depth = input_data.max_depth
-
-        for pdf_path in sorted(working_dir.glob(pattern)):
+        max_depth = input_data.max_depth if input_data.recursive else 0
+
+        # Name pattern filter (NFC normalize for macOS NFD filenames)
+        name_filter = None
+        if input_data.name_pattern:
+            pattern_match = _compile_name_pattern(input_data.name_pattern).match
+
+            def name_filter(name: str) -> bool:
+                name = name.lower()
+                if not name.isascii():  # ASCII names are already NFC
+                    name = unicodedata.normalize('NFC', name)
+                return pattern_match(name) is not None
+
+        # Directory walk runs off the event loop (slow on network filesystems).
+        # Page counting stays on this thread: pdfium is not thread-safe, and read_pdf
+        # also drives it from the event loop thread.
+        # The unfiltered listing is cached, so different patterns share it
+        # Paths stay plain strings: no Path object per listed file
+        def find_pdfs() -> list[str]:
+            pdf_paths = _list_pdf_paths(str(working_dir), max_depth)
+            if name_filter is None:
+                return pdf_paths
+            basename = os.path.basename
+            return [pdf_path for pdf_path in pdf_paths if name_filter(basename(pdf_path))]
+
+        pdf_paths = await asyncio.to_thread(find_pdfs)
+
+        for pdf_path in pdf_paths:
             try:
-                # Skip if not a file
-                if not pdf_path.is_file():
-                    continue
-
-                # Check depth limit
-                if max_depth is not None and input_data.recursive:
-                    relative_path = pdf_path.relative_to(working_dir)
-                    depth = len(relative_path.parts) - 1  # -1 for filename
-                    if depth > max_depth:
-                        continue
-
-                # Check name pattern filter (NFC normalize for macOS NFD filenames)
-                if input_data.name_pattern:
-                    normalized_name = unicodedata.normalize('NFC', pdf_path.name.lower())
-                    normalized_pattern = unicodedata.normalize('NFC', input_data.name_pattern.lower())
-                    if not fnmatch.fnmatch(normalized_name, normalized_pattern):
-                        continue
-
-                # Get page count using pypdfium2
-                pdf_doc = pdfium.PdfDocument(str(pdf_path))
-                total_pages = len(pdf_doc)
-                pdf_doc.close()
+                # Get page count using pypdfium2 (unchanged files come from the cache)
+                total_pages = _count_pages_cached(pdf_path)
 
                 # Add to list
                 pdfs.append(PDFInfo(
-                    name=pdf_path.name,
-                    path=str(pdf_path),
+                    name=os.path.basename(pdf_path),
+                    path=pdf_path,
                     pages=total_pages
                 ))
 
@@ -163,24 +481,236 @@ async def list_pdfs_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]
             working_directory=str(working_dir)
         )
 
-        return output.model_dump_json(indent=2), []
+        return _dump_json(output), []
 
     except PermissionError as e:
         error = ListPDFsError(
             error="PERMISSION_DENIED",
             message=f"Permission denied: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
+        return _dump_json(error), []
     except Exception as e:
         # Return error using schema
         error = ListPDFsError(
             error="INTERNAL_ERROR",
             message=f"Failed to list PDFs: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
+        return _dump_json(error), []
 
 
-async def read_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
+def _page_cache_get(key: tuple) -> Optional[dict]:
+    """Return the cached extraction state of a page (None on miss)"""
+    entry = _page_cache.get(key)
+    if entry is None:
+        return None
+    _page_cache.move_to_end(key)
+    return entry[0]
+
+
+def _page_cache_put(key: tuple, state: dict) -> None:
+    """
+    Cache the extraction state of a page, evicting least recently used pages
+
+    Args:
+        key: File version, page number and output options
+        state: Page state with the encoded page image (no pending jobs)
+    """
+    global _page_cache_bytes
+
+    limit = config.page_cache_mb * 1024 * 1024
+    # Image bytes (raw and base64) dominate; text is counted by length
+    size = (
+        (len(state['page_image'][0]) + len(state['page_image'][1]) if state['page_image'] is not None else 0)
+        + sum(len(image['data']) + len(image['b64']) for image in state['embedded_images'])
+        + sum(len(line['text']) for line in state['text_lines'])
+        + sum(len(table['markdown']) for table in state['tables'])
+    )
+    if size > limit:
+        return
+
+    old = _page_cache.pop(key, None)
+    if old is not None:
+        _page_cache_bytes -= old[1]
+    _page_cache[key] = (state, size)
+    _page_cache_bytes += size
+    while _page_cache_bytes > limit:
+        _, (_, evicted_size) = _page_cache.popitem(last=False)
+        _page_cache_bytes -= evicted_size
+
+
+@contextlib.contextmanager
+def _borrow_plumber_pdf(pdf_bytes: bytes, file_key: Optional[tuple]) -> Iterator[Any]:
+    """
+    Borrow a parsed pdfplumber document, opening one if none is idle
+
+    The document goes back to the pool afterwards, so later requests for the
+    same file version skip re-parsing it. Without a file_key, on error, or
+    when the file alone exceeds the config.page_cache_mb budget, the document
+    is closed instead. Callers flush each page's cache after use, so idle
+    documents keep no parsed page objects.
+
+    Args:
+        pdf_bytes: Complete PDF file contents
+        file_key: (path, mtime_ns, size) identifying the file version
+
+    Returns:
+        Context manager yielding a pdfplumber PDF used by this thread only
+    """
+    import pdfplumber
+
+    pdf = None
+    if file_key is not None:
+        with _plumber_pool_lock:
+            idle = _plumber_pool.get(file_key)
+            if idle:
+                pdf = idle.pop()
+                _plumber_pool.move_to_end(file_key)
+    if pdf is None:
+        pdf = pdfplumber.open(io.BytesIO(pdf_bytes))
+
+    try:
+        yield pdf
+    except BaseException:
+        pdf.close()
+        raise
+
+    limit = config.page_cache_mb * 1024 * 1024
+    if file_key is None or file_key[2] > limit:
+        pdf.close()  # Unidentified version, or too large to keep idle
+        return
+
+    evicted = []
+    with _plumber_pool_lock:
+        _plumber_pool.setdefault(file_key, []).append(pdf)
+        _plumber_pool.move_to_end(file_key)
+        idle_count = sum(len(idle) for idle in _plumber_pool.values())
+        idle_bytes = sum(key[2] * len(idle) for key, idle in _plumber_pool.items())
+        while idle_count > PLUMBER_POOL_SIZE or idle_bytes > limit:
+            # Evict from the least recently used file version
+            oldest_key, oldest = next(iter(_plumber_pool.items()))
+            evicted.append(oldest.pop())
+            if not oldest:
+                del _plumber_pool[oldest_key]
+            idle_count -= 1
+            idle_bytes -= oldest_key[2]
+    for old_pdf in evicted:
+        old_pdf.close()
+
+
+def _extract_pages_text(
+    pdf_bytes: bytes,
+    page_nums: list[int],
+    mode: str,
+    file_key: Optional[tuple] = None,
+    on_page: Optional[Callable[[dict], None]] = None,
+    stop: Optional[threading.Event] = None
+) -> list[dict]:
+    """
+    Extract tables, text regions and corruption status for a set of pages
+
+    Runs on a background thread with its own pdfplumber document (pdfplumber
+    objects must not be shared between threads), borrowed from the pool of
+    parsed documents when one is idle for this file version.
+
+    Args:
+        pdf_bytes: Complete PDF file contents
+        page_nums: Page numbers to process (1-indexed)
+        mode: Extraction mode ('auto' or 'text_only')
+        file_key: (path, mtime_ns, size) for caching pdfminer corruption checks
+        on_page: Called with each page's result as soon as it is ready
+        stop: When set, no further pages are started (the caller gave up)
+
+    Returns:
+        One dict per page with tables, text lines, corruption result and the
+        pdfplumber image placements used to position embedded images
+    """
+    results = []
+    with _borrow_plumber_pdf(pdf_bytes, file_key) as pdf:
+        for page_num in page_nums:
+            if stop is not None and stop.is_set():
+                break
+            page = pdf.pages[page_num - 1]  # 0-based index
+
+            # Extract tables first (to get bboxes)
+            # Default "lines" strategy builds tables from ruling edges only, so pages
+            # without lines/rects/curves cannot have any: skip table detection there
+            tables_with_position = []
+            table_bboxes = []
+
+            if page.lines or page.rects or page.curves:
+                # One detection pass drives both cell text and bboxes
+                # (extract_tables() would re-run find_tables())
+                for i, table_obj in enumerate(page.find_tables()):
+                    table_data = table_obj.extract()
+                    md = convert_table_to_markdown(table_data) if table_data else ""
+                    if md:
+                        tables_with_position.append({
+                            'top': table_obj.bbox[1],
+                            'markdown': f"**Table {i+1}**\n\n{md}"
+                        })
+                        table_bboxes.append(table_obj.bbox)
+
+            # Extract text EXCLUDING table regions (prevent duplication!)
+            text_regions = extract_non_table_text_regions(page, table_bboxes)
+
+            # Treat each region as a single "line" for ordering
+            text_lines_for_ordering = [
+                {'top': region['top'], 'text': region['text']}
+                for region in text_regions
+            ]
+
+            full_text = '\n\n'.join([r['text'] for r in text_regions])  # Full text (excluding tables)
+
+            # Auto-detect text corruption
+            text_corrupted = False
+            corruption_ratio = 0.0
+
+            # Nothing extracted → nothing to judge (skips the pdfminer re-parse on image pages)
+            if full_text or tables_with_position:
+                # Include table content in corruption check
+                # (only the leading sample is inspected: skip the concat once text fills it)
+                all_text_for_check = full_text
+                if tables_with_position and len(full_text) < CORRUPTION_SAMPLE_CHARS:
+                    table_texts = '\n\n'.join(t['markdown'] for t in tables_with_position)
+                    all_text_for_check = f"{full_text}\n\n{table_texts}" if full_text else table_texts
+
+                # Cheap character-based check first; too little text can't be judged by it
+                if len(all_text_for_check) >= config.min_corruption_check_chars:
+                    text_corrupted, corruption_ratio = is_text_corrupted(all_text_for_check)
+                    suspicious = corruption_ratio > config.corruption_threshold / 2
+                else:
+                    suspicious = True
+
+                # pdfminer re-parses the whole page: only for text that is not clearly
+                # clean, and not in text_only mode (no page image is rendered). Clean
+                # text is trusted even if the file's structure would draw pdfminer
+                # warnings: the page image exists to replace unreadable text.
+                if mode != 'text_only' and suspicious and not text_corrupted:
+                    pdfminer_corrupted, warning_count = check_pdf_corruption_with_pdfminer(
+                        io.BytesIO(pdf_bytes), page_num, file_key
+                    )
+                    if pdfminer_corrupted:
+                        text_corrupted = True
+                        corruption_ratio = warning_count / 10
+
+            results.append({
+                'page_num': page_num,
+                'tables': tables_with_position,
+                'text_lines': text_lines_for_ordering,
+                'text_corrupted': text_corrupted,
+                'corruption_ratio': corruption_ratio,
+                # Only needed for embedded image placement (auto mode)
+                'images': list(page.images) if mode == 'auto' else [],
+                'height': page.height
+            })
+            if on_page is not None:
+                on_page(results[-1])
+            # The document outlives this call: drop the page's parsed objects
+            page.flush_cache()
+    return results
+
+
+async def _read_pdf(arguments: dict[str, Any]) -> tuple[Union[ReadPDFSuccess, ReadPDFError], list[dict]]:
     """
     Read PDF with page and image limits, intelligent validation
 
@@ -195,19 +725,27 @@ async def read_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
         arguments: Dictionary matching ReadPDFInput schema
 
     Returns:
-        Tuple of (JSON string, list of image dicts)
-        - JSON has image placeholders like [IMAGE_0], [IMAGE_1]
-        - Images list: [{"data": bytes, "format": "jpeg"|"png"}, ...]
-          (MCP SDK Image wrapper handles base64 encoding)
+        Tuple of (response model, list of image dicts)
+        - Response has image placeholders like [IMAGE_0], [IMAGE_1]
+        - Images list: [{"data": bytes, "b64": str, "format": "jpeg"|"png"}, ...]
+          ("b64" is the base64 form of "data", sent as MCP ImageContent)
     """
+    import pdfplumber
+    import pikepdf
+    import pypdfium2 as pdfium
+    from PIL import Image
+
     try:
         # Validate input
         input_data = ReadPDFInput(**arguments)
 
+        # Resolve current directory once (reused as security base)
+        cwd = Path.cwd().resolve()
+
         # Resolve PDF path
         pdf_path = Path(input_data.file_path)
         if not pdf_path.is_absolute():
-            pdf_path = Path.cwd() / pdf_path
+            pdf_path = cwd / pdf_path
         pdf_path = pdf_path.resolve()
 
         # Check file exists
@@ -221,17 +759,16 @@ async def read_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
                 message=error_message,
                 suggested_files=similar_files if similar_files else None
             )
-            return error.model_dump_json(indent=2), []
+            return error, []
 
         # Security: Check for path traversal attacks
         # The file must be within the current working directory or its subdirectories
-        cwd = Path.cwd().resolve()
-        if not validate_path_security(pdf_path, cwd):
+        if not validate_path_security(pdf_path, cwd, resolved=True):
             error = ReadPDFError(
                 error="PERMISSION_DENIED",
                 message="Access denied: File path must be within the current working directory"
             )
-            return error.model_dump_json(indent=2), []
+            return error, []
 
         # Check read permission
         if not os.access(pdf_path, os.R_OK):
@@ -239,7 +776,7 @@ async def read_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
                 error="PERMISSION_DENIED",
                 message=f"Permission denied: Cannot read file {pdf_path}"
             )
-            return error.model_dump_json(indent=2), []
+            return error, []
 
         # Validate limits BEFORE processing
         validation = validate_pdf_read_request(
@@ -257,363 +794,480 @@ async def read_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
                 total_images=validation.total_images,
                 suggested_ranges=validation.suggested_ranges
             )
-            return error.model_dump_json(indent=2), []
-
-        # Open PDF with pdfplumber for text extraction
-        # Also open pikepdf once for image extraction (if needed)
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            total_pages = len(pdf.pages)
-            end_page = min(input_data.end_page or total_pages, total_pages)
-
-            pages_data = []
-            total_images_count = 0
-            extracted_images = []  # List of {"data": bytes, "format": "jpeg"|"png"}
-            image_index = 0  # Global image index for placeholders
-
-            # Check if we need pikepdf for image extraction
-            mode = input_data.extraction_mode
-            need_pikepdf = (mode == 'auto')  # Only auto mode extracts document images
-
-            # Open pikepdf once outside the loop (if needed)
-            pike_pdf = None
-            if need_pikepdf:
-                try:
-                    pike_pdf = pikepdf.open(str(pdf_path))
-                except Exception as e:
-                    logger.warning(f"Failed to open PDF with pikepdf: {e}")
+            return error, []
 
+        mode = input_data.extraction_mode
+
+        # Identifies this version of the file in the corruption-check cache
+        st = os.stat(pdf_path)
+        file_key = (str(pdf_path), st.st_mtime_ns, st.st_size)
+
+        # Read the file once; every backend parses from this in-memory copy
+        pdf_bytes = pdf_path.read_bytes()
+
+        # pypdfium2 document: page count, image_only text hints and page rendering.
+        # pdfium is not thread-safe, so it is only used from this thread.
+        pdfium_doc = pdfium.PdfDocument(pdf_bytes)
+        total_pages = len(pdfium_doc)
+        end_page = min(input_data.end_page or total_pages, total_pages)
+
+        pages_data = []
+        total_images_count = 0
+        extracted_images = []  # List of {"data": bytes, "b64": str, "format": "jpeg"|"png"}
+        image_index = 0  # Global image index for placeholders
+
+        page_nums = list(range(input_data.start_page, end_page + 1))
+
+        # Pages extracted by earlier calls with the same file version and options
+        page_cache_options = (
+            mode,
+            input_data.crop_images,
+            input_data.max_image_dimension,
+            input_data.page_image_dpi,
+            input_data.filter_header_footer
+        )
+        cached_states = {}
+        if config.page_cache_mb > 0:
+            for page_num in page_nums:
+                cached = _page_cache_get((*file_key, page_num, *page_cache_options))
+                if cached is not None:
+                    cached_states[page_num] = cached
+        extract_page_nums = [page_num for page_num in page_nums if page_num not in cached_states]
+
+        # Check if we need pikepdf for image extraction
+        # (only auto mode extracts document images)
+        need_pikepdf = (mode == 'auto' and bool(extract_page_nums))
+
+        # Open pikepdf once outside the loop (if needed), from the same bytes as
+        # the other backends; it is closed when this read finishes
+        pike_pdf = None
+        if need_pikepdf:
             try:
-                # Process pages in order (preserves text/image ordering)
-                for page_num in range(input_data.start_page, end_page + 1):
-                    if page_num > total_pages:
-                        break
-
-                    page = pdf.pages[page_num - 1]  # 0-based index
-
-                    # Check extraction mode (mode already set above)
-                    skip_text_extraction = (mode == 'image_only')
-
-                    # Variables for text extraction hint (image_only mode)
-                    extractable_char_count = None
-                    text_hint = None
-
-                    if skip_text_extraction:
-                        # Skip text and table extraction entirely
-                        tables_with_position = []
-                        table_bboxes = []
-                        text_lines_for_ordering = []
-                        full_text = ""
-
-                        # Check for extractable text (to provide hint)
-                        page_text = page.extract_text() or ''
-                        char_count = len(page_text.strip())
-                        if char_count > 0:
-                            extractable_char_count = char_count
-
-                            # Check corruption to determine hint
+                pike_pdf = pikepdf.open(io.BytesIO(pdf_bytes))
+            except Exception as e:
+                logger.warning(f"Failed to open PDF with pikepdf: {e}")
+
+        # Thread pool for page image post-processing (created on first rendered page)
+        executor = None
+        page_image_jobs = []  # Every submitted encode job (they read pdfium bitmaps)
+        text_executor = None
+        extract_task = None
+        stop_extraction = threading.Event()
+        page_states = []  # Per-page extraction results, assembled after the loop
+
+        try:
+            # Text/table extraction and corruption checks (pdfplumber + pdfminer) run
+            # on one background thread. Both are pure Python and hold the GIL, so more
+            # threads would not run in parallel, only parse the document once each.
+            # Each page's result is published as soon as it is ready, so the loop
+            # below renders and extracts images for early pages while later pages
+            # are still being extracted.
+            # (image_only needs neither: its text hint comes from pypdfium2)
+            text_futures = {}
+            if mode != 'image_only' and extract_page_nums:
+                loop = asyncio.get_running_loop()
+                text_futures = {page_num: loop.create_future() for page_num in extract_page_nums}
+
+                def publish_text_result(result: dict) -> None:
+                    # Runs on a worker thread: hand the result over to the event loop
+                    loop.call_soon_threadsafe(text_futures[result['page_num']].set_result, result)
+
+                text_executor = ThreadPoolExecutor(max_workers=1)
+                extract_task = loop.run_in_executor(
+                    text_executor, _extract_pages_text, pdf_bytes, extract_page_nums, mode, file_key,
+                    publish_text_result, stop_extraction
+                )
+
+            # Process pages in order (preserves text/image ordering)
+            for page_num in page_nums:
+                cached = cached_states.get(page_num)
+                if cached is not None:
+                    page_states.append({**cached, 'page_image_job': None, 'page_bitmap': None, 'cached': True})
+                    continue
+
+                # Variables for text extraction hint (image_only mode)
+                extractable_char_count = None
+                text_hint = None
+                page_image_placements = []
+                page_height = None
+
+                if mode == 'image_only':
+                    # Skip text and table extraction entirely
+                    tables_with_position = []
+                    text_lines_for_ordering = []
+                    text_corrupted = False
+                    corruption_ratio = 0.0
+
+                    # Check for extractable text (to provide hint)
+                    textpage = pdfium_doc[page_num - 1].get_textpage()
+                    page_text = (textpage.get_text_range() or '').replace('\r\n', '\n')  # pdfium uses CRLF
+                    textpage.close()
+                    char_count = len(page_text.strip())
+                    if char_count > 0:
+                        extractable_char_count = char_count
+
+                        # Check corruption to determine hint
+                        # (pdfminer re-parse only when the characters look suspicious)
+                        is_corrupted, ratio = is_text_corrupted(page_text)
+                        if not is_corrupted and ratio > config.corruption_threshold / 2:
                             pdfminer_corrupted, warning_count = check_pdf_corruption_with_pdfminer(
-                                str(pdf_path), page_num
+                                io.BytesIO(pdf_bytes), page_num, file_key
                             )
                             if pdfminer_corrupted:
                                 is_corrupted = True
                                 ratio = warning_count / 10
-                            else:
-                                is_corrupted, ratio = is_text_corrupted(page_text)
-
-                            if is_corrupted:
-                                corruption_pct = int(ratio * 100)
-                                text_hint = f"{char_count} chars ({corruption_pct}% corrupted). Text extraction not recommended."
-                            else:
-                                text_hint = f"{char_count} chars extractable. Use 'auto' to get text."
-                    else:
-                        # Extract tables first (to get bboxes)
-                        tables_raw = page.extract_tables()
-                        tables_with_position = []
-                        table_bboxes = []
-
-                        if tables_raw:
-                            table_objects = page.find_tables()
-                            for i, (table_data, table_obj) in enumerate(zip(tables_raw, table_objects)):
-                                md = convert_table_to_markdown(table_data) if table_data else ""
-                                if md:
-                                    tables_with_position.append({
-                                        'top': table_obj.bbox[1],
-                                        'markdown': f"**Table {i+1}**\n\n{md}"
-                                    })
-                                    table_bboxes.append(table_obj.bbox)
-
-                        # Extract text EXCLUDING table regions (prevent duplication!)
-                        text_regions = extract_non_table_text_regions(page, table_bboxes)
-
-                        # Use text_regions instead of text_lines
-                        text_lines_for_ordering = []
-                        for region in text_regions:
-                            # Treat each region as a single "line"
-                            text_lines_for_ordering.append({
-                                'top': region['top'],
-                                'text': region['text']
-                            })
-
-                        full_text = '\n\n'.join(r['text'] for r in text_regions)  # Full text (excluding tables)
-
-                    # Auto-detect text corruption (only if extracting text)
-                    text_corrupted = False
-                    corruption_ratio = 0.0
 
-                    if not skip_text_extraction:
-                        pdfminer_corrupted, warning_count = check_pdf_corruption_with_pdfminer(
-                            str(pdf_path), page_num
+                        if is_corrupted:
+                            corruption_pct = int(ratio * 100)
+                            text_hint = f"{char_count} chars ({corruption_pct}% corrupted). Text extraction not recommended."
+                        else:
+                            text_hint = f"{char_count} chars extractable. Use 'auto' to get text."
+                else:
+                    text_future = text_futures[page_num]
+                    if not text_future.done():
+                        await asyncio.wait((text_future, extract_task), return_when=asyncio.FIRST_COMPLETED)
+                    if not text_future.done():
+                        await extract_task  # The worker failed before this page: raise its error
+                    text_result = text_future.result()
+                    tables_with_position = text_result['tables']
+                    text_lines_for_ordering = text_result['text_lines']
+                    text_corrupted = text_result['text_corrupted']
+                    corruption_ratio = text_result['corruption_ratio']
+                    page_image_placements = text_result['images']
+                    page_height = text_result['height']
+
+                # Provide full page as image based on extraction mode
+                page_image_job = None
+                page_image_failed = False
+                page_bitmap = None  # Keeps pdfium bitmap memory alive until encoding finishes
+
+                # Determine if we should include page image
+                should_include_image = (
+                    mode == 'image_only' or                  # Always in image_only mode
+                    (mode == 'auto' and text_corrupted)      # Auto mode: only if corrupted
+                )
+                # mode == 'text_only' never includes page image
+
+                if should_include_image:
+                    try:
+                        logger.info(f"Page {page_num}: Attempting to render page image (mode={mode}, text_corrupted={text_corrupted})")
+                        # Render page image with pypdfium2 (no external dependencies!)
+                        # pdfium is not thread-safe, so rendering stays on this thread
+                        pdfium_page = pdfium_doc[page_num - 1]  # 0-indexed
+
+                        # Calculate scale based on DPI (PDF base is 72 DPI), capped so pdfium
+                        # renders directly at the final size (no LANCZOS pass afterwards)
+                        page_width_pt, page_height_pt = pdfium_page.get_size()
+                        max_dim = input_data.max_image_dimension
+                        scale = min(
+                            input_data.page_image_dpi / 72,
+                            max_dim / page_width_pt,
+                            max_dim / page_height_pt
                         )
-
-                        # Use pdfminer warnings first, fallback to character-based detection
-                        if pdfminer_corrupted:
-                            text_corrupted = True
-                            corruption_ratio = warning_count / 10
+                        # RGBX bitmap (opaque, RGB byte order): PIL maps it without a
+                        # BGR→RGB swizzle, and JPEG encodes RGBX directly
+                        page_bitmap = pdfium_page.render(scale=scale, rev_byteorder=True, prefer_bgrx=True)
+                        page_img = page_bitmap.to_pil()  # Shares the bitmap buffer
+                        pdfium_page.close()
+
+                        logger.info(f"Page {page_num}: pypdfium2 rendered page as {page_img.size}")
+
+                        if page_img:
+                            # Whiteout/resize/JPEG encode on the pool (Pillow releases the GIL)
+                            if executor is None:
+                                executor = ThreadPoolExecutor(
+                                    max_workers=min(MAX_PAGE_IMAGE_WORKERS, end_page - input_data.start_page + 1)
+                                )
+                            page_image_job = executor.submit(
+                                _encode_page_image,
+                                page_img,
+                                input_data.filter_header_footer,
+                                input_data.max_image_dimension
+                            )
+                            page_image_jobs.append(page_image_job)
                         else:
-                            # Include table content in corruption check
-                            all_text_for_check = full_text
-                            if tables_with_position:
-                                table_texts = '\n\n'.join(t['markdown'] for t in tables_with_position)
-                                all_text_for_check = f"{full_text}\n\n{table_texts}" if full_text else table_texts
-
-                            text_corrupted, corruption_ratio = is_text_corrupted(all_text_for_check)
-
-                    # Provide full page as image based on extraction mode
-                    page_image_base64 = None
-                    page_img_width = None
-                    page_img_height = None
-
-                    # Determine if we should include page image
-                    should_include_image = (
-                        mode == 'image_only' or                  # Always in image_only mode
-                        (mode == 'auto' and text_corrupted)      # Auto mode: only if corrupted
-                    )
-                    # mode == 'text_only' never includes page image
-
-                    if should_include_image:
-                        try:
-                            logger.info(f"Page {page_num}: Attempting to render page image (mode={mode}, text_corrupted={text_corrupted})")
-                            # Render page image with pypdfium2 (no external dependencies!)
-                            pdfium_doc = pdfium.PdfDocument(str(pdf_path))
-                            pdfium_page = pdfium_doc[page_num - 1]  # 0-indexed
-
-                            # Calculate scale based on DPI (PDF base is 72 DPI)
-                            scale = input_data.page_image_dpi / 72
-                            bitmap = pdfium_page.render(scale=scale)
-                            page_img = bitmap.to_pil()
-                            pdfium_doc.close()
-
-                            logger.info(f"Page {page_num}: pypdfium2 rendered page as {page_img.size}")
-
-                            if page_img:
-
-                                # White-out header/footer if filter enabled (for image_only mode)
+                            logger.warning(f"Page {page_num}: pypdfium2 failed to render page")
+                    except Exception as e:
+                        page_image_failed = True
+                        logger.error(f"Page {page_num}: Failed to render page image: {e}")
+                        logger.error(f"Page {page_num}: Traceback: {traceback.format_exc()}")
+
+                # Extract images with pikepdf (skip if image_only or text_only mode)
+                page_embedded_images = []
+
+                # text_only mode: skip all image extraction
+                skip_image_extraction = (mode == 'image_only' or mode == 'text_only')
+
+                if not skip_image_extraction and pike_pdf:
+                    # Get image position info from pdfplumber, keyed by XObject name
+                    # (pikepdf and pdfplumber list images in no guaranteed common order;
+                    # an XObject drawn several times keeps its first placement)
+                    pdfplumber_by_name = {}
+                    for plumber_img in page_image_placements:
+                        pdfplumber_by_name.setdefault(plumber_img.get('name'), plumber_img)
+
+                    # Extract actual image data with pikepdf (use pre-opened pike_pdf)
+                    try:
+                        pike_page = pike_pdf.pages[page_num - 1]
+
+                        for img_name, raw_image in pike_page.images.items():
+                            try:
+                                # pikepdf names carry the leading '/' ('/Im0' vs 'Im0')
+                                pdf_img_info = pdfplumber_by_name.get(img_name.lstrip('/'))
+
+                                # Extract image using pikepdf (dimensions come from the
+                                # image dictionary, so no decode is needed yet)
+                                pdf_image = pikepdf.PdfImage(raw_image)
+                                img_width, img_height = pdf_image.width, pdf_image.height
+
+                                # Get display size from pdfplumber (actual size in PDF page)
+                                display_width = img_width
+                                display_height = img_height
+
+                                if pdf_img_info is not None:
+                                    # Calculate display size from bbox (in PDF points)
+                                    # pdfplumber provides width/height in PDF points
+                                    if 'width' in pdf_img_info and 'height' in pdf_img_info:
+                                        # PDF points to pixels (assuming 72 DPI base, scale to reasonable size)
+                                        # Limit to actual display size in PDF
+                                        display_width = int(pdf_img_info['width'])
+                                        display_height = int(pdf_img_info['height'])
+
+                                needs_resize = img_width > display_width or img_height > display_height
+                                if needs_resize:
+                                    # Calculate scale to fit within display size while keeping aspect ratio
+                                    scale = min(display_width / img_width, display_height / img_height)
+                                    new_width = int(img_width * scale)
+                                    new_height = int(img_height * scale)
+                                else:
+                                    new_width, new_height = img_width, img_height
+
+                                # Filter header/footer if enabled, before any decoding:
+                                # by placement (entirely inside the header/footer band) and by
+                                # final size/aspect ratio (known from the dictionary + display box)
                                 if input_data.filter_header_footer:
-                                    from PIL import ImageDraw
-                                    draw = ImageDraw.Draw(page_img)
-                                    width, height = page_img.size
-                                    # Header: top 6% of page
-                                    header_height = int(height * config.header_footer_ratio)
-                                    draw.rectangle([0, 0, width, header_height], fill='white')
-                                    # Footer: bottom 6% of page
-                                    footer_start = int(height * config.footer_start_ratio)
-                                    draw.rectangle([0, footer_start, width, height], fill='white')
-
-                                # Resize page image to fit within max_image_dimension
-                                width, height = page_img.size
-                                max_dim = input_data.max_image_dimension
-                                if width > max_dim or height > max_dim:
-                                    scale = min(max_dim / width, max_dim / height)
-                                    new_width = int(width * scale)
-                                    new_height = int(height * scale)
-                                    page_img = page_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-                                # Convert to RGB if necessary (JPEG doesn't support RGBA)
-                                if page_img.mode in ('RGBA', 'LA', 'P'):
-                                    page_img = page_img.convert('RGB')
-
-                                buffered = io.BytesIO()
-                                page_img.save(buffered, format="JPEG", quality=config.jpeg_quality)
-
-                                # Add to extracted images with raw bytes (MCP SDK handles base64 encoding)
-                                extracted_images.append({
-                                    "data": buffered.getvalue(),  # raw bytes
-                                    "format": "jpeg"              # format for Image wrapper
-                                })
-                                logger.info(f"Page {page_num}: Added page image to extracted_images, total={len(extracted_images)}")
-                                page_image_base64 = f"[IMAGE_{image_index}]"
-                                image_index += 1
-                                total_images_count += 1  # Count page images too
-
-                                page_img_width = page_img.width
-                                page_img_height = page_img.height
-
-                                # Note: text_hint not set here since text_corrupted
-                                # already triggers corruption warning in UI
-                            else:
-                                logger.warning(f"Page {page_num}: pypdfium2 failed to render page")
-                        except Exception as e:
-                            import traceback
-                            logger.error(f"Page {page_num}: Failed to render page image: {e}")
-                            logger.error(f"Page {page_num}: Traceback: {traceback.format_exc()}")
-
-                    # Extract images with pikepdf (skip if image_only or text_only mode)
-                    images_with_position = []
-
-                    # text_only mode: skip all image extraction
-                    skip_image_extraction = (mode == 'image_only' or mode == 'text_only')
-
-                    if not skip_image_extraction and pike_pdf:
-                        # Get image position info from pdfplumber
-                        pdfplumber_images = page.images if hasattr(page, 'images') else []
-
-                        # Extract actual image data with pikepdf (use pre-opened pike_pdf)
-                        try:
-                            pike_page = pike_pdf.pages[page_num - 1]
-
-                            for img_index, (img_name, raw_image) in enumerate(pike_page.images.items()):
-                                try:
-                                    # Extract image using pikepdf
-                                    pdf_image = pikepdf.PdfImage(raw_image)
+                                    if pdf_img_info is not None and page_height:
+                                        if (
+                                            pdf_img_info.get('bottom', page_height) <= page_height * config.header_footer_ratio
+                                            or pdf_img_info.get('top', 0) >= page_height * config.footer_start_ratio
+                                        ):
+                                            continue
+                                    if is_header_footer_image({"width": new_width, "height": new_height}):
+                                        continue
+
+                                # Plain RGB/gray JPEG that already fits: pass the stored
+                                # stream through instead of decoding and re-encoding as PNG
+                                # (CMYK, /Decode arrays and other filters still go through PIL)
+                                if (
+                                    not needs_resize
+                                    and pdf_image.filters == ['/DCTDecode']
+                                    and pdf_image.mode in ('RGB', 'L')
+                                    and raw_image.get('/Decode') is None
+                                ):
+                                    img_buffer = io.BytesIO()
+                                    pdf_image.extract_to(stream=img_buffer)
+                                    img_bytes = img_buffer.getvalue()
+                                    img_format = 'jpeg'
+                                else:
                                     pil_image = pdf_image.as_pil_image()
 
-                                    # Get display size from pdfplumber (actual size in PDF page)
-                                    display_width = pil_image.width
-                                    display_height = pil_image.height
-
-                                    if img_index < len(pdfplumber_images):
-                                        pdf_img_info = pdfplumber_images[img_index]
-                                        # Calculate display size from bbox (in PDF points)
-                                        # pdfplumber provides width/height in PDF points
-                                        if 'width' in pdf_img_info and 'height' in pdf_img_info:
-                                            # PDF points to pixels (assuming 72 DPI base, scale to reasonable size)
-                                            # Limit to actual display size in PDF
-                                            display_width = int(pdf_img_info['width'])
-                                            display_height = int(pdf_img_info['height'])
-
                                     # Resize image to fit within display size while maintaining aspect ratio
-                                    if pil_image.width > display_width or pil_image.height > display_height:
-                                        from PIL import Image as PILImage
-                                        # Calculate scale to fit within display size while keeping aspect ratio
-                                        scale = min(display_width / pil_image.width, display_height / pil_image.height)
-                                        new_width = int(pil_image.width * scale)
-                                        new_height = int(pil_image.height * scale)
+                                    if needs_resize:
                                         pil_image = pil_image.resize(
                                             (new_width, new_height),
-                                            PILImage.Resampling.LANCZOS
+                                            Image.Resampling.LANCZOS
                                         )
 
                                     # Convert PIL image to bytes
                                     img_buffer = io.BytesIO()
                                     pil_image.save(img_buffer, format='PNG')
                                     img_bytes = img_buffer.getvalue()
+                                    img_format = 'png'
+
+                                # Crop image if enabled (additional max dimension limit)
+                                if input_data.crop_images:
+                                    result = crop_image_to_max_dimension(
+                                        img_bytes,
+                                        input_data.max_image_dimension
+                                    )
+
+                                    # Skip if image is too small and discarded
+                                    if result[0] is None:
+                                        continue
+
+                                    img_bytes = result[0]
+
+                                # Get position from pdfplumber if available
+                                top = pdf_img_info.get('top', 0) if pdf_img_info is not None else 0
+
+                                # Placeholder index is assigned during assembly (after page image)
+                                page_embedded_images.append({
+                                    'top': top,
+                                    'data': img_bytes,    # raw bytes
+                                    'b64': _b64encode(img_bytes),
+                                    'format': img_format  # png, or jpeg when passed through
+                                })
 
-                                    # Create img_data dict for header/footer filter
-                                    img_data = {
-                                        "image": img_bytes,
-                                        "width": pil_image.width,
-                                        "height": pil_image.height
-                                    }
-
-                                    # Filter header/footer if enabled
-                                    if input_data.filter_header_footer:
-                                        if is_header_footer_image(img_data):
-                                            continue
-
-                                    # Crop image if enabled (additional max dimension limit)
-                                    if input_data.crop_images:
-                                        result = crop_image_to_max_dimension(
-                                            img_bytes,
-                                            input_data.max_image_dimension
-                                        )
-
-                                        # Skip if image is too small and discarded
-                                        if result[0] is None:
-                                            continue
-
-                                        img_bytes = result[0]
-
-                                    # Add to extracted images with raw bytes (MCP SDK handles base64 encoding)
-                                    extracted_images.append({
-                                        "data": img_bytes,   # raw bytes
-                                        "format": "png"      # format for Image wrapper
-                                    })
-                                    img_placeholder = f"[IMAGE_{image_index}]"
-                                    image_index += 1
-
-                                    # Get position from pdfplumber if available
-                                    top = pdfplumber_images[img_index].get('top', 0) if img_index < len(pdfplumber_images) else 0
-
-                                    images_with_position.append({
-                                        'top': top,
-                                        'image_data': img_placeholder  # Use placeholder instead of base64
-                                    })
-                                    total_images_count += 1
-
-                                except Exception as e:
-                                    logger.debug(f"Failed to extract image {img_index} on page {page_num}: {e}")
-                                    continue
-                        except Exception as e:
-                            logger.warning(f"Failed to extract images with pikepdf on page {page_num}: {e}")
-
-                    # Reconstruct content order (using text excluding tables)
-                    ordered_blocks_raw = order_content_blocks(
-                        text_lines_for_ordering,
-                        tables_with_position,
-                        images_with_position
-                    )
+                            except Exception as e:
+                                logger.debug(f"Failed to extract image {img_name} on page {page_num}: {e}")
+                                continue
+                    except Exception as e:
+                        logger.warning(f"Failed to extract images with pikepdf on page {page_num}: {e}")
+
+                page_states.append({
+                    'page_num': page_num,
+                    'text_lines': text_lines_for_ordering,
+                    'tables': tables_with_position,
+                    'embedded_images': page_embedded_images,
+                    'page_image_job': page_image_job,
+                    'page_image': None,  # (jpeg_bytes, jpeg_base64, width, height) once encoded
+                    'page_image_failed': page_image_failed,
+                    'page_bitmap': page_bitmap,
+                    'text_corrupted': text_corrupted,
+                    'corruption_ratio': corruption_ratio,
+                    'extractable_char_count': extractable_char_count,
+                    'text_hint': text_hint
+                })
+
+            # Assemble pages in order: placeholder numbering follows page order
+            # (page image first, then embedded images), as in a sequential pass
+            for state in page_states:
+                page_num = state['page_num']
+                text_corrupted = state['text_corrupted']
+
+                page_image_base64 = None
+                page_img_width = None
+                page_img_height = None
+                page_image_failed = state['page_image_failed']
+
+                if state['page_image_job'] is not None or state['page_image'] is not None:
+                    try:
+                        if state['page_image'] is None:
+                            # Awaited, not .result(): other requests keep running while it encodes
+                            state['page_image'] = await asyncio.wrap_future(state['page_image_job'])
+                        image_bytes, image_b64, page_img_width, page_img_height = state['page_image']
+
+                        # Add to extracted images with raw bytes and their (cached) base64 form
+                        extracted_images.append({
+                            "data": image_bytes,  # raw bytes
+                            "b64": image_b64,     # sent as ImageContent data
+                            "format": "jpeg"
+                        })
+                        logger.info(f"Page {page_num}: Added page image to extracted_images, total={len(extracted_images)}")
+                        page_image_base64 = f"[IMAGE_{image_index}]"
+                        image_index += 1
+                        total_images_count += 1  # Count page images too
+
+                        # Note: text_hint not set here since text_corrupted
+                        # already triggers corruption warning in UI
+                    except Exception as e:
+                        page_img_width = page_img_height = None
+                        page_image_failed = True
+                        logger.error(f"Page {page_num}: Failed to render page image: {e}")
+                        logger.error(f"Page {page_num}: Traceback: {traceback.format_exc()}")
+                    finally:
+                        state['page_bitmap'] = None  # Encoding done, release pdfium memory
+
+                images_with_position = []
+                for embedded in state['embedded_images']:
+                    # Add to extracted images with raw bytes and their (cached) base64 form
+                    extracted_images.append({
+                        "data": embedded['data'],     # raw bytes
+                        "b64": embedded['b64'],       # sent as ImageContent data
+                        "format": embedded['format']
+                    })
+                    images_with_position.append({
+                        'top': embedded['top'],
+                        'image_data': f"[IMAGE_{image_index}]"  # Use placeholder instead of base64
+                    })
+                    image_index += 1
+                    total_images_count += 1
+
+                # Reconstruct content order (using text excluding tables)
+                ordered_blocks_raw = order_content_blocks(
+                    state['text_lines'],
+                    state['tables'],
+                    images_with_position
+                )
 
-                    # Merge adjacent text blocks
-                    ordered_blocks = merge_adjacent_text_blocks(ordered_blocks_raw)
+                # Merge adjacent text blocks
+                ordered_blocks = merge_adjacent_text_blocks(ordered_blocks_raw)
 
-                    # Convert to ContentBlock (simple conversion!)
-                    content_blocks = []
+                # Convert to ContentBlock (simple conversion!)
+                content_blocks = []
 
-                    # CRITICAL: Skip adding corrupted text/tables if text is corrupted
-                    # This applies to both Auto mode (text_corrupted=True) and image_only mode
-                    should_skip_text_blocks = (
-                        (mode == 'auto' and text_corrupted) or  # Auto mode: skip if corrupted
-                        mode == 'image_only'                     # image_only: always skip
-                    )
+                # CRITICAL: Skip adding corrupted text/tables if text is corrupted
+                # This applies to both Auto mode (text_corrupted=True) and image_only mode
+                should_skip_text_blocks = (
+                    (mode == 'auto' and text_corrupted) or  # Auto mode: skip if corrupted
+                    mode == 'image_only'                     # image_only: always skip
+                )
 
-                    if should_skip_text_blocks:
-                        # Only add image blocks (if any), skip text and table blocks
-                        for block in ordered_blocks:
-                            if block['type'] == 'image':
-                                content_blocks.append(ContentBlock(
-                                    type=block['type'],
-                                    content=block.get('content')
-                                ))
-                    else:
-                        # Normal mode: add all blocks
-                        for block in ordered_blocks:
-                            content = block.get('content')
-                            # Clean up text blocks
-                            if block['type'] == 'text' and content:
-                                content = content.strip()
-                                # Skip page number separators like "- 2 -", "- 10 -"
-                                if re.match(r'^-\s*\d+\s*-$', content):
-                                    continue
+                if should_skip_text_blocks:
+                    # Only add image blocks (if any), skip text and table blocks
+                    for block in ordered_blocks:
+                        if block['type'] == 'image':
                             content_blocks.append(ContentBlock(
                                 type=block['type'],
-                                content=content
+                                content=block.get('content')
                             ))
+                else:
+                    # Normal mode: add all blocks
+                    for block in ordered_blocks:
+                        content = block.get('content')
+                        # Clean up text blocks
+                        if block['type'] == 'text' and content:
+                            content = content.strip()
+                            # Skip page number separators like "- 2 -", "- 10 -"
+                            if _PAGE_NUM_RE.match(content):
+                                continue
+                        content_blocks.append(ContentBlock(
+                            type=block['type'],
+                            content=content
+                        ))
+
+                # Keep the page for later calls (not if its page image failed to encode)
+                if config.page_cache_mb > 0 and not state.get('cached') and not page_image_failed:
+                    _page_cache_put(
+                        (*file_key, page_num, *page_cache_options),
+                        {
+                            key: value for key, value in state.items()
+                            if key not in ('page_image_job', 'page_bitmap')
+                        }
+                    )
 
-                    pages_data.append(PageData(
-                        page_number=page_num,
-                        content_blocks=content_blocks,
-                        text_corrupted=text_corrupted if text_corrupted else None,
-                        corruption_ratio=corruption_ratio if text_corrupted else None,
-                        page_image=page_image_base64,
-                        page_image_width=page_img_width,
-                        page_image_height=page_img_height,
-                        extractable_char_count=extractable_char_count,
-                        text_hint=text_hint
-                    ))
-            finally:
-                # Close pikepdf if it was opened
-                if pike_pdf:
-                    pike_pdf.close()
+                pages_data.append(PageData(
+                    page_number=page_num,
+                    content_blocks=content_blocks,
+                    text_corrupted=text_corrupted if text_corrupted else None,
+                    corruption_ratio=state['corruption_ratio'] if text_corrupted else None,
+                    page_image=page_image_base64,
+                    page_image_width=page_img_width,
+                    page_image_height=page_img_height,
+                    extractable_char_count=state['extractable_char_count'],
+                    text_hint=state['text_hint']
+                ))
+        finally:
+            # Never block the event loop here: on an error or cancellation, stop
+            # the text worker after its current page and drop queued encode jobs
+            stop_extraction.set()
+            if text_executor is not None:
+                text_executor.shutdown(wait=False, cancel_futures=True)
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            # Running jobs still read pdfium bitmaps and the text worker still holds
+            # a pooled pdfplumber document: await them before letting go of either
+            running = [asyncio.wrap_future(job) for job in page_image_jobs if not job.done()]
+            if extract_task is not None and not extract_task.done():
+                running.append(extract_task)
+            if running:
+                await asyncio.wait(running)
+            if extract_task is not None and extract_task.done() and not extract_task.cancelled():
+                extract_task.exception()  # Already raised above if it mattered
+            # Close pikepdf (if it was opened) and pypdfium2
+            if pike_pdf:
+                pike_pdf.close()
+            pdfium_doc.close()
 
         # Create success response
         output = ReadPDFSuccess(
@@ -624,45 +1278,368 @@ async def read_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
         )
 
         logger.info(f"Returning {len(extracted_images)} images")
-        # Remove null values for clean output
-        return output.model_dump_json(indent=2, exclude_none=True), extracted_images
+        return output, extracted_images
 
     except FileNotFoundError as e:
         error = ReadPDFError(
             error="FILE_NOT_FOUND",
             message=f"PDF file not found: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
+        return error, []
     except PermissionError as e:
         error = ReadPDFError(
             error="PERMISSION_DENIED",
             message=f"Permission denied accessing PDF: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
+        return error, []
     except (pikepdf.PdfError, pdfplumber.pdfminer.pdfparser.PDFSyntaxError) as e:
         error = ReadPDFError(
             error="INVALID_PDF",
             message=f"Invalid or corrupted PDF file: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
+        return error, []
     except Exception as e:
         # Return error with more specific context
         error = ReadPDFError(
             error="INVALID_PDF",
             message=f"Error processing PDF: {type(e).__name__}: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
+        return error, []
+
 
+async def read_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
+    """
+    Read PDF as a JSON response (see _read_pdf)
 
+    Args:
+        arguments: Dictionary matching ReadPDFInput schema
+
+    Returns:
+        Tuple of (JSON string, list of image dicts)
+    """
+    response, images = await _read_pdf(arguments)
+    # Remove null values for clean output (successful reads only)
+    return _dump_json(response, exclude_none=isinstance(response, ReadPDFSuccess)), images
+
+
+async def read_pdf_data(arguments: dict[str, Any]) -> tuple[dict, list[dict]]:
+    """
+    Read PDF as a plain dict, for callers that post-process the response
+
+    Same content as read_pdf_handler's JSON, without a serialize/parse round-trip.
+
+    Args:
+        arguments: Dictionary matching ReadPDFInput schema
+
+    Returns:
+        Tuple of (response dict, list of image dicts)
+    """
+    response, images = await _read_pdf(arguments)
+    return response.model_dump(exclude_none=isinstance(response, ReadPDFSuccess)), images
+
+
+@functools.lru_cache(maxsize=1)
 def check_pdfgrep_installed() -> bool:
-    """Check if pdfgrep is available in PATH"""
+    """
+    Check if pdfgrep is available in PATH
+
+    The PATH lookup runs once per process; call
+    check_pdfgrep_installed.cache_clear() to re-check after installing pdfgrep.
+    """
     return shutil.which("pdfgrep") is not None
 
 
+# Regex syntax whose meaning depends on the locale: '.' and bracket expressions
+# match one byte instead of one character under C, and backslash escapes such
+# as \w or \b classify bytes instead of letters
+_LOCALE_SENSITIVE_CHARS = frozenset('.[\\')
+
+
+def _grep_locale(pattern: str, fixed_strings: bool) -> Optional[str]:
+    """
+    Locale for a pdfgrep search: C when byte-wise matching gives the same results
+
+    An ASCII literal matches the same lines byte-wise as character-wise (ASCII
+    bytes never occur inside UTF-8 multibyte sequences), and the C locale skips
+    pdfgrep's slower multibyte regex path. Patterns with '.', bracket
+    expressions or escapes, and non-ASCII patterns (e.g. Korean), keep the
+    inherited locale so they still match accented and multibyte text.
+
+    Args:
+        pattern: Search pattern
+        fixed_strings: Pattern is a literal string (pdfgrep -F)
+
+    Returns:
+        "C", or None to inherit the process locale
+    """
+    if not pattern.isascii():
+        return None
+    if fixed_strings or _LOCALE_SENSITIVE_CHARS.isdisjoint(pattern):
+        return "C"
+    return None
+
+
+async def _iter_output_lines(stream: asyncio.StreamReader, max_length: int) -> AsyncIterator[bytes]:
+    """
+    Yield the lines of a process output stream, skipping overlong ones
+
+    Unlike StreamReader.readline(), which raises once a line outgrows the
+    stream limit, a line longer than max_length is dropped whole (up to its
+    newline) and reading continues with the next line.
+
+    Args:
+        stream: Process stdout
+        max_length: Longest line kept, in bytes (newline excluded)
+
+    Returns:
+        Async iterator of lines without the trailing newline
+    """
+    pending = b''
+    skipping = False  # Inside a line that is already over max_length
+    while True:
+        chunk = await stream.read(GREP_READ_CHUNK)
+        if not chunk:
+            if pending and not skipping:
+                yield pending  # Last line without a trailing newline
+            return
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()  # Incomplete last line
+        for line in lines:
+            if skipping:
+                skipping = False  # Newline ending the overlong line
+            elif len(line) <= max_length:
+                yield line
+            else:
+                logger.warning(f"Skipping pdfgrep output line longer than {max_length} bytes")
+        if len(pending) > max_length:
+            if not skipping:
+                logger.warning(f"Skipping pdfgrep output line longer than {max_length} bytes")
+            pending = b''
+            skipping = True
+
+
+async def _run_pdfgrep(
+    cmd: list[str],
+    cwd: str,
+    limit: Optional[int] = None,
+    locale: Optional[str] = None
+) -> tuple[int, list[GrepMatch], str, bool]:
+    """
+    Run one pdfgrep process without blocking the event loop
+
+    stdout is parsed line by line as it arrives; once `limit` matches have
+    been read the process is terminated instead of waiting for it to finish.
+    Output lines over GREP_LINE_LIMIT are skipped. The process is killed if
+    the awaiting task is cancelled (e.g. timeout) or reading fails.
+
+    Args:
+        cmd: Full pdfgrep command line
+        cwd: Working directory for the process
+        limit: Stop after this many matches (None = read all output)
+        locale: LC_ALL/LANG for the process (None = inherit)
+
+    Returns:
+        Tuple of (return code, matches, stderr, stopped_early)
+    """
+    env = None
+    if locale is not None:
+        env = {**os.environ, "LC_ALL": locale, "LANG": locale}
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=env
+    )
+    stderr_task = asyncio.ensure_future(proc.stderr.read())  # Drained concurrently (no pipe stall)
+    matches = []
+    stopped_early = False
+    # Hot loop: bind lookups to locals once
+    parse_line = _parse_pdfgrep_line
+    append_match = matches.append
+    remaining = -1 if limit is None else limit  # Never reaches 0 when unlimited
+
+    try:
+        async for raw_line in _iter_output_lines(proc.stdout, GREP_LINE_LIMIT):
+            match = parse_line(raw_line.decode('utf-8', errors='replace'))
+            if match is None:
+                continue
+            append_match(match)
+            remaining -= 1
+            if remaining == 0:
+                stopped_early = True
+                proc.terminate()
+                break
+        stderr_bytes = await stderr_task
+        returncode = await proc.wait()
+    except BaseException:
+        # Cancelled (e.g. timeout) or failed: don't leave the process or the
+        # stderr reader behind
+        stderr_task.cancel()
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+        raise
+
+    if stopped_early:
+        returncode = 0  # Terminated by us after enough matches, not a pdfgrep failure
+
+    return returncode, matches, stderr_bytes.decode('utf-8', errors='replace'), stopped_early
+
+
+async def _grep_pdf_file(
+    cmd: list[str],
+    pdf_file: Union[str, Path],
+    cwd: str,
+    limit: Optional[int] = None,
+    locale: Optional[str] = None
+) -> tuple[int, list[GrepMatch], str]:
+    """
+    Run pdfgrep on one PDF, reusing the result of an identical earlier search
+
+    Results are cached per (file, mtime, size, command line, locale); an edited file
+    changes mtime/size and so misses the cache. Errors and runs cut short by
+    `limit` are not cached.
+
+    Args:
+        cmd: pdfgrep command line without the search target
+        pdf_file: PDF file to search
+        cwd: Working directory for the process
+        limit: Stop after this many matches (None = all)
+        locale: LC_ALL/LANG for pdfgrep (None = inherit)
+
+    Returns:
+        Tuple of (return code, matches, stderr)
+    """
+    try:
+        st = os.stat(pdf_file)
+    except OSError:
+        returncode, matches, stderr, _ = await _run_pdfgrep(cmd + [str(pdf_file)], cwd, limit, locale)
+        return returncode, matches, stderr
+
+    key = (str(pdf_file), st.st_mtime_ns, st.st_size, tuple(cmd), locale)
+    cached = _grep_cache.get(key)
+    if cached is not None:
+        _grep_cache.move_to_end(key)
+        returncode, matches, stderr = cached
+        return returncode, matches[:limit], stderr
+
+    returncode, matches, stderr, stopped_early = await _run_pdfgrep(cmd + [str(pdf_file)], cwd, limit, locale)
+    if returncode != 2 and not stopped_early:
+        _grep_cache[key] = (returncode, matches, stderr)
+        if len(_grep_cache) > GREP_CACHE_SIZE:
+            _grep_cache.popitem(last=False)  # Evict least recently used
+    return returncode, matches, stderr
+
+
+async def _grep_pdf_files(
+    cmd: list[str],
+    pdf_files: list[str],
+    cwd: str,
+    max_count: int,
+    locale: Optional[str] = None
+) -> tuple[int, list[GrepMatch], str]:
+    """
+    Run pdfgrep once per PDF, at most one process per CPU core at a time
+
+    Every run may supply up to max_count matches. Results are merged in
+    pdf_files order and the search stops once the files merged so far hold
+    max_count matches: runs for later files are cancelled (their pdfgrep
+    processes killed) or never started. The result is therefore the first
+    max_count matches in file order, whatever order the runs finish in.
+
+    Each pdfgrep run is its own OS process, so this already spreads the
+    parsing over all cores; a Python process pool on top would only add
+    worker start-up and result pickling.
+
+    Args:
+        cmd: pdfgrep command line without the search target
+        pdf_files: PDF files to search
+        cwd: Working directory for the processes
+        max_count: Global match limit
+        locale: LC_ALL/LANG for pdfgrep (None = inherit)
+
+    Returns:
+        Tuple of (return code, merged matches, stderr) - return code 2 only
+        for errors that affect every file (e.g. invalid pattern)
+    """
+    semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+    async def search(pdf_file: str) -> tuple[int, list[GrepMatch], str]:
+        async with semaphore:
+            return await _grep_pdf_file(cmd, pdf_file, cwd, max_count, locale)
+
+    tasks = [asyncio.ensure_future(search(pdf_file)) for pdf_file in pdf_files]
+    all_matches = []
+    try:
+        for pdf_file, task in zip(pdf_files, tasks):
+            returncode, matches, stderr = await task
+            if returncode == 2:
+                error_msg = stderr.strip()
+                if "Invalid" in error_msg or "regex" in error_msg.lower():
+                    return returncode, [], stderr
+                # Unreadable or broken PDF: skip it instead of failing the whole search
+                logger.warning(f"pdfgrep failed on {pdf_file}: {error_msg}")
+            all_matches.extend(matches)
+            if len(all_matches) >= max_count:
+                break  # Later files cannot change the first max_count matches
+    finally:
+        # Stop runs that are no longer needed (no-op for finished ones)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return 0, all_matches[:max_count], ""
+
+
+def _parse_pdfgrep_line(line: str) -> Optional[GrepMatch]:
+    """
+    Parse one pdfgrep "file.pdf:page:text" output line
+
+    Args:
+        line: pdfgrep output line (-n -H), without trailing newline
+
+    Returns:
+        GrepMatch, or None for context separators and malformed lines
+    """
+    # Single C-level match; the lazy file group still allows ':' inside filenames.
+    # Context separators ('--') and context lines ('file-page-text') don't match.
+    m = _GREP_LINE_RE.match(line)
+    if m is None:
+        return None
+    # Fields come straight from the regex groups: skip Pydantic validation
+    return GrepMatch.model_construct(file=m.group(1), page=int(m.group(2)), text=m.group(3))
+
+
+def _grep_output(matches: list[GrepMatch], max_count: int) -> GrepPDFOutput:
+    """
+    Build the grep_pdf response from up to max_count + 1 matches
+
+    Args:
+        matches: Matches found (one beyond max_count means more exist)
+        max_count: Matches to return
+
+    Returns:
+        GrepPDFOutput
+    """
+    truncated = len(matches) > max_count
+    matches = matches[:max_count]
+    files_found = {match.file for match in matches}
+    return GrepPDFOutput.model_construct(
+        matches=matches,
+        total=len(matches),
+        truncated=truncated,
+        files_searched=len(files_found)
+    )
+
+
 async def grep_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
     """
     Search PDF files using pdfgrep.
 
+    Single files and directories go through the same pdfgrep (same regex
+    dialect and text extraction); results are cached per file version.
+
     Args:
         arguments: Dictionary matching GrepPDFInput schema
 
@@ -677,52 +1654,52 @@ async def grep_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
                 message="pdfgrep is not installed. Please install it first.",
                 install_hint="brew install pdfgrep (macOS) or apt install pdfgrep (Ubuntu)"
             )
-            return error.model_dump_json(indent=2), []
+            return _dump_json(error), []
 
         # 2. Validate input
         input_data = GrepPDFInput(**arguments)
 
-        # 3. Resolve target path
-        if input_data.file_path:
-            target_path = Path(input_data.file_path)
-            if not target_path.is_absolute():
-                target_path = Path.cwd() / target_path
-            target_path = target_path.resolve()
+        # 3. Resolve target path (one stat; no Path objects or resolve() walk)
+        target_path = os.path.abspath(input_data.file_path or input_data.working_directory)
+        try:
+            target_mode = os.stat(target_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            target_mode = None
 
-            if not target_path.exists():
+        if input_data.file_path:
+            if target_mode is None:
                 error = GrepPDFError(
                     error="FILE_NOT_FOUND",
                     message=f"PDF file not found: {target_path}"
                 )
-                return error.model_dump_json(indent=2), []
+                return _dump_json(error), []
 
-            if not target_path.suffix.lower() == '.pdf':
+            if not _is_pdf_name(target_path):
                 error = GrepPDFError(
                     error="FILE_NOT_FOUND",
                     message=f"Not a PDF file: {target_path}"
                 )
-                return error.model_dump_json(indent=2), []
+                return _dump_json(error), []
         else:
-            target_path = Path(input_data.working_directory)
-            if not target_path.is_absolute():
-                target_path = Path.cwd() / target_path
-            target_path = target_path.resolve()
-
-            if not target_path.exists():
+            if target_mode is None:
                 error = GrepPDFError(
                     error="DIRECTORY_NOT_FOUND",
                     message=f"Directory not found: {target_path}"
                 )
-                return error.model_dump_json(indent=2), []
+                return _dump_json(error), []
 
-            if not target_path.is_dir():
+            if not stat.S_ISDIR(target_mode):
                 error = GrepPDFError(
                     error="DIRECTORY_NOT_FOUND",
                     message=f"Not a directory: {target_path}"
                 )
-                return error.model_dump_json(indent=2), []
+                return _dump_json(error), []
 
-        # 4. Build pdfgrep command
+        # One match beyond max_count is fetched so `truncated` reflects whether
+        # more matches exist, not just whether exactly max_count were found
+        fetch_count = input_data.max_count + 1
+
+        # 4. Build pdfgrep command (search target is appended per run)
         cmd = ["pdfgrep", "-n", "-H"]  # Always include page number and filename
 
         if input_data.ignore_case:
@@ -731,40 +1708,46 @@ async def grep_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
             cmd.append("-F")
         if input_data.context > 0:
             cmd.extend(["-C", str(input_data.context)])
-        if input_data.max_count:
-            cmd.extend(["-m", str(input_data.max_count)])
-        if input_data.recursive and not input_data.file_path:
-            cmd.append("-r")
+        if input_data.file_path:
+            # Single file: pdfgrep's own -m stops it. In directory searches -m would be
+            # per file; there the streaming reader terminates pdfgrep at the global cap.
+            cmd.extend(["-m", str(fetch_count)])
         # Only add --page-range if not using defaults (start=1, end=all)
         if input_data.start_page != 1 or input_data.end_page is not None:
             end = input_data.end_page or 9999  # pdfgrep handles out-of-range gracefully
             cmd.extend(["--page-range", f"{input_data.start_page}-{end}"])
 
         cmd.append(input_data.pattern)
-        cmd.append(str(target_path))
 
-        logger.info(f"Running pdfgrep command: {' '.join(cmd)}")
+        locale = _grep_locale(input_data.pattern, input_data.fixed_strings)
 
-        # 5. Execute with timeout
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=str(target_path.parent) if input_data.file_path else str(target_path)
+        # 5. Execute with timeout (non-blocking: other requests keep running meanwhile)
+        if input_data.file_path:
+            logger.info(f"Running pdfgrep command: {' '.join(cmd)} {target_path}")
+            run = _grep_pdf_file(cmd, target_path, os.path.dirname(target_path), None, locale)
+        else:
+            # Directory: one pdfgrep per PDF, sharded over CPU cores, instead of a
+            # single-threaded `pdfgrep -r`
+            max_depth = None if input_data.recursive else 0
+            pdf_files = await asyncio.to_thread(
+                lambda: sorted(_walk_pdf_files(target_path, max_depth, skip_dirs=_GREP_SKIP_DIRS), key=_path_sort_key)
             )
-        except subprocess.TimeoutExpired:
+            logger.info(f"Running pdfgrep command: {' '.join(cmd)} over {len(pdf_files)} PDFs")
+            run = _grep_pdf_files(cmd, pdf_files, target_path, fetch_count, locale)
+
+        try:
+            returncode, matches, stderr = await asyncio.wait_for(run, timeout=60)
+        except asyncio.TimeoutError:
             error = GrepPDFError(
                 error="INTERNAL_ERROR",
                 message="Search timed out after 60 seconds"
             )
-            return error.model_dump_json(indent=2), []
+            return _dump_json(error), []
 
         # 6. Check for errors
-        if result.returncode == 2:
+        if returncode == 2:
             # pdfgrep returns 2 for errors (invalid regex, etc.)
-            error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+            error_msg = stderr.strip() if stderr else "Unknown error"
             if "Invalid" in error_msg or "regex" in error_msg.lower():
                 error = GrepPDFError(
                     error="INVALID_PATTERN",
@@ -775,65 +1758,20 @@ async def grep_pdf_handler(arguments: dict[str, Any]) -> tuple[str, list[dict]]:
                     error="INTERNAL_ERROR",
                     message=f"pdfgrep error: {error_msg}"
                 )
-            return error.model_dump_json(indent=2), []
-
-        # 7. Parse output: "file.pdf:page:text" format
-        matches = []
-        files_found = set()
+            return _dump_json(error), []
 
-        if result.stdout.strip():
-            for line in result.stdout.strip().split('\n'):
-                if not line or line == '--':  # Skip empty lines and context separators
-                    continue
-
-                # Parse "file:page:text" format
-                # Handle case where filename might contain ':'
-                parts = line.split(':')
-                if len(parts) >= 3:
-                    # Find the page number (should be numeric)
-                    file_parts = []
-                    page_idx = -1
-
-                    for i, part in enumerate(parts):
-                        if part.isdigit() and i > 0:
-                            page_idx = i
-                            break
-                        file_parts.append(part)
-
-                    if page_idx > 0:
-                        file_path_str = ':'.join(file_parts)
-                        try:
-                            page_num = int(parts[page_idx])
-                            text = ':'.join(parts[page_idx + 1:])
-
-                            matches.append(GrepMatch(
-                                file=file_path_str,
-                                page=page_num,
-                                text=text
-                            ))
-                            files_found.add(file_path_str)
-                        except ValueError:
-                            # Skip malformed lines
-                            continue
-
-        # 8. Return output
-        output = GrepPDFOutput(
-            matches=matches,
-            total=len(matches),
-            truncated=len(matches) >= input_data.max_count,
-            files_searched=len(files_found) if files_found else 0
-        )
-        return output.model_dump_json(indent=2), []
+        # 7. Matches were parsed from "file.pdf:page:text" lines while streaming
+        return _dump_json(_grep_output(matches, input_data.max_count)), []
 
     except PermissionError as e:
         error = GrepPDFError(
             error="PERMISSION_DENIED",
             message=f"Permission denied: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
+        return _dump_json(error), []
     except Exception as e:
         error = GrepPDFError(
             error="INTERNAL_ERROR",
             message=f"Error during search: {type(e).__name__}: {str(e)}"
         )
-        return error.model_dump_json(indent=2), []
\ No newline at end of file
+        return _dump_json(error), []
\ No newline at end of file
@@ -227,7 +227,7 @@ class GrepPDFInput(BaseModel):
     """Input schema for grep_pdf tool"""
     pattern: str = Field(
         ...,
-        description="Search pattern (regex by default)"
+        description="Search pattern: POSIX extended regex as pdfgrep interprets it (e.g. [[:digit:]]+), for single files and directories alike. ASCII patterns without '.', bracket expressions or backslash escapes (and ASCII fixed strings) are matched byte-wise under the C locale, which finds the same lines faster; all other patterns match characters in the server's locale"
     )
     file_path: Optional[str] = Field(
         default=None,
@@ -259,7 +259,7 @@ class GrepPDFInput(BaseModel):
     )
     recursive: bool = Field(
         default=True,
-        description="Include subdirectories when searching directory"
+        description="Include subdirectories when searching directory (hidden dirs and node_modules are skipped)"
     )
     start_page: int = Field(
         default=1,
@@ -284,7 +284,7 @@ class GrepPDFOutput(BaseModel):
     """Successful grep_pdf response"""
     matches: List[GrepMatch] = Field(description="List of matches found")
     total: int = Field(description="Total matches returned")
-    truncated: bool = Field(description="True if results were limited by max_count")
+    truncated: bool = Field(description="True if more matches exist beyond max_count")
     files_searched: int = Field(description="Number of PDF files searched")
 
 
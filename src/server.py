@@ -32,8 +32,7 @@ if str(SCRIPT_DIR) not in sys.path:
 # Imports after sys.path modification (intentional)
 from mcp.server import Server  # noqa: E402
 from mcp.server.stdio import stdio_server  # noqa: E402
-from mcp.server.fastmcp.utilities.types import Image  # noqa: E402
-from mcp.types import Tool, TextContent, CallToolResult  # noqa: E402
+from mcp.types import Tool, TextContent, ImageContent, CallToolResult  # noqa: E402
 
 from src.pdf_tools import list_pdfs_handler, read_pdf_handler, grep_pdf_handler  # noqa: E402
 from src.config import config  # noqa: E402
@@ -181,7 +180,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "pattern": {
                         "type": "string",
-                        "description": "Search pattern (regex by default)"
+                        "description": "Search pattern: POSIX extended regex as pdfgrep interprets it (e.g. [[:digit:]]+), for single files and directories alike. ASCII patterns without '.', bracket expressions or backslash escapes (and ASCII fixed strings) are matched byte-wise under the C locale, which finds the same lines faster; all other patterns match characters in the server's locale"
                     },
                     "file_path": {
                         "type": "string",
@@ -218,7 +217,7 @@ async def list_tools() -> list[Tool]:
                     },
                     "recursive": {
                         "type": "boolean",
-                        "description": "Include subdirectories when searching directory",
+                        "description": "Include subdirectories when searching directory (hidden dirs and node_modules are skipped)",
                         "default": True
                     },
                     "start_page": {
@@ -264,14 +263,16 @@ async def call_tool(name: str, arguments: dict) -> CallToolResult:
         result_json, images = await read_pdf_handler(arguments)
 
         # Build response: TextContent first, then ImageContent for each image
-        # Using Image wrapper for proper MCP-compliant image serialization
         content = [TextContent(type="text", text=result_json)]
 
         for img in images:
-            # Create Image wrapper with raw bytes and format
-            # Image.to_image_content() handles base64 encoding automatically
-            image_wrapper = Image(data=img["data"], format=img["format"])
-            content.append(image_wrapper.to_image_content())
+            # Images come base64-encoded already (and cached with their page),
+            # so no encoding pass here
+            content.append(ImageContent(
+                type="image",
+                data=img["b64"],
+                mimeType=f"image/{img['format']}"
+            ))
 
         return CallToolResult(
             content=content,
@@ -3,13 +3,21 @@ Table conversion utility
 Convert pdfplumber tables to Markdown format
 Includes merged cell handling
 """
+from itertools import zip_longest
 from typing import List
 
+# Placeholder for cells a short row does not have (only used while transposing)
+_MISSING = object()
+
 
 def fill_merged_cells(table: List[List]) -> List[List]:
     """
     Handle merged cells: fill empty cells (None) with value from above
 
+    Columns are filled one at a time on the transposed table; only the
+    first row's columns are filled, extra cells of longer rows are kept.
+    A table without empty cells is returned as-is (not copied).
+
     Args:
         table: pdfplumber extract_tables() result (list of lists)
 
@@ -19,26 +27,45 @@ def fill_merged_cells(table: List[List]) -> List[List]:
     if not table or len(table) == 0:
         return table
 
-    # Process each column
-    filled_table = [row[:] for row in table]  # Copy
+    width = len(table[0])
+    if width == 0:
+        return [row[:] for row in table]  # Copy
 
-    for col_idx in range(len(filled_table[0])):
-        last_value = None
+    strip = str.strip
 
-        for row in filled_table:
-            if col_idx >= len(row):
-                continue
-
-            cell = row[col_idx]
+    # Most tables have no empty cells: nothing to fill, return the table as-is
+    if not any(
+        not cell or (type(cell) is str and not strip(cell))
+        for row in table for cell in row
+    ):
+        return table
 
+    filled_columns = []
+    for column in zip_longest(*(row[:width] for row in table), fillvalue=_MISSING):
+        last_value = ''  # Stored values are non-empty, so no `or ''` per fill
+        filled = []
+        append = filled.append
+        for cell in column:
             # Copy value from above if cell is empty
-            if cell is None or (isinstance(cell, str) and cell.strip() == ''):
-                row[col_idx] = last_value or ''
+            # (pdfplumber cells are None or str: `not cell` catches both empties)
+            if not cell or (type(cell) is str and not strip(cell)):
+                append(last_value)
             else:
-                # Store value if present
-                last_value = cell
+                # Store value if present (short rows keep their placeholder)
+                if cell is not _MISSING:
+                    last_value = cell
+                append(cell)
+        filled_columns.append(filled)
 
-    return filled_table
+    filled_rows = zip(*filled_columns)
+    if all(len(row) == width for row in table):
+        return [list(row) for row in filled_rows]
+
+    # Ragged table: drop placeholders, keep cells beyond the first row's width
+    return [
+        list(filled[:len(row)]) + row[width:]
+        for row, filled in zip(table, filled_rows)
+    ]
 
 
 def convert_table_to_markdown(table: List[List]) -> str:
@@ -57,40 +84,23 @@ def convert_table_to_markdown(table: List[List]) -> str:
     # Handle merged cells
     filled_table = fill_merged_cells(table)
 
-    # Convert None to empty string
-    cleaned_table = []
-    for row in filled_table:
-        cleaned_row = [str(cell).strip() if cell is not None else "" for cell in row]
-        cleaned_table.append(cleaned_row)
-
     # Column count
-    max_cols = max(len(row) for row in cleaned_table)
-
-    # Normalize all rows to same column count
-    normalized_table = []
-    for row in cleaned_table:
-        while len(row) < max_cols:
-            row.append("")
-        normalized_table.append(row[:max_cols])
-
-    if len(normalized_table) == 0:
-        return ""
-
-    # Generate Markdown
-    lines = []
-
-    # First row as header
-    header = normalized_table[0]
-    lines.append("| " + " | ".join(header) + " |")
-
-    # Separator line
-    lines.append("| " + " | ".join(["---"] * max_cols) + " |")
-
-    # Data rows
-    for row in normalized_table[1:]:
-        lines.append("| " + " | ".join(row) + " |")
-
-    return "\n".join(lines)
+    max_cols = max(len(row) for row in filled_table)
+
+    # Separator line (built once, emitted after the header row)
+    separator = "| " + " | ".join(["---"] * max_cols) + " |"
+
+    def markdown_lines():
+        # One pass per row: None → "", strip, pad to max_cols, format
+        for row_idx, row in enumerate(filled_table):
+            cells = ["" if cell is None else str(cell).strip() for cell in row]
+            if len(cells) < max_cols:
+                cells.extend([""] * (max_cols - len(cells)))
+            yield "| " + " | ".join(cells) + " |"
+            if row_idx == 0:  # First row as header
+                yield separator
+
+    return "\n".join(markdown_lines())
 
 
 def convert_tables_to_markdown(tables: List[List[List[str]]]) -> List[str]:
@@ -2,6 +2,7 @@
 Text extraction utility
 Extract only text excluding table regions to prevent duplication
 """
+import bisect
 from typing import List, Dict
 
 
@@ -23,43 +24,51 @@ def extract_non_table_text_regions(page, table_bboxes: List[tuple]) -> List[Dict
         text = page.extract_text()
         return [{'top': 0, 'text': text}] if text else []
 
+    from pdfplumber.utils import extract_text as chars_to_text  # Deferred: keeps server start-up light
+
     # Sort bboxes by top coordinate
     sorted_tables = sorted(table_bboxes, key=lambda b: b[1])
 
-    text_regions = []
     page_height = page.height
     page_width = page.width
 
-    # Region before first table
+    # Text regions as (top, bottom): above the first table, between tables, below the last.
+    # Tables are sorted by top, so regions come out sorted and non-overlapping.
+    regions = []
     first_table = sorted_tables[0]
     if first_table[1] > 0:  # If top is greater than 0
-        above_bbox = (0, 0, page_width, first_table[1])
-        above_region = page.within_bbox(above_bbox)
-        text = above_region.extract_text()
-        if text and text.strip():
-            text_regions.append({'top': 0, 'text': text})
-
-    # Regions between tables
-    for i in range(len(sorted_tables) - 1):
-        current_table = sorted_tables[i]
-        next_table = sorted_tables[i + 1]
-
-        # Between current table end and next table start
-        between_bbox = (0, current_table[3], page_width, next_table[1])
-
+        regions.append((0, first_table[1]))
+    for current_table, next_table in zip(sorted_tables, sorted_tables[1:]):
         if next_table[1] > current_table[3]:  # If there's space
-            between_region = page.within_bbox(between_bbox)
-            text = between_region.extract_text()
-            if text and text.strip():
-                text_regions.append({'top': current_table[3], 'text': text})
-
-    # Region after last table
+            regions.append((current_table[3], next_table[1]))
     last_table = sorted_tables[-1]
     if last_table[3] < page_height:
-        below_bbox = (0, last_table[3], page_width, page_height)
-        below_region = page.within_bbox(below_bbox)
-        text = below_region.extract_text()
+        regions.append((last_table[3], page_height))
+
+    if not regions:
+        return []
+
+    # Bucket the page's chars into regions in one pass (instead of one within_bbox
+    # filter over all chars per region). Like within_bbox, a char must lie fully
+    # inside its region; chars crossing a table edge are dropped. Page order is kept.
+    region_tops = [region[0] for region in regions]
+    buckets = [[] for _ in regions]
+    for char in page.chars:
+        idx = bisect.bisect_right(region_tops, char['top']) - 1
+        if (
+            idx >= 0
+            and char['bottom'] <= regions[idx][1]
+            and char['x0'] >= 0
+            and char['x1'] <= page_width
+        ):
+            buckets[idx].append(char)
+
+    text_regions = []
+    for (region_top, _), bucket in zip(regions, buckets):
+        if not bucket:
+            continue
+        text = chars_to_text(bucket)
         if text and text.strip():
-            text_regions.append({'top': last_table[3], 'text': text})
+            text_regions.append({'top': region_top, 'text': text})
 
     return text_regions
@@ -2,45 +2,150 @@
 Text corruption detection utility
 Detect PDF structure corruption with pdfminer.six → Provide corrupted pages as images
 """
+import functools
 import re
-import io
 import logging
-from contextlib import redirect_stderr
-from typing import Tuple
-from pdfminer.high_level import extract_text
+import os
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Optional, Tuple, Union
 
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
-
-def check_pdf_corruption_with_pdfminer(pdf_path: str, page_num: int) -> Tuple[bool, int]:
+# is_text_corrupted only inspects this many leading characters
+CORRUPTION_SAMPLE_CHARS = 500
+
+# pdfminer corruption results per (file, mtime, size, page), least recently used first
+PDFMINER_CACHE_SIZE = 512
+_pdfminer_cache: "OrderedDict[tuple, Tuple[bool, int]]" = OrderedDict()
+_pdfminer_cache_lock = threading.Lock()  # Pages are checked from worker threads
+
+# Characters typical of broken font encodings (mostly Latin-1 glyphs out of context)
+_KNOWN_CORRUPTED_CHARS = frozenset([
+    '‹', 'Œ', 'Ù', 'Ú', 'Û', 'Ü', 'ñ', 'û', 'ý', 'Þ',
+    'Å', 'Æ', 'Ç', 'È', 'É', 'Ê', 'Ë', 'Î', 'Ï',
+    'Ñ', 'Ò', 'Ó', 'Ô', 'Õ', 'Ö', 'ß', 'à', 'á', 'â',
+    'ã', 'ä', 'å', 'æ', 'ç', 'è', 'é', 'ê', 'ë', 'ì',
+    'í', 'î', 'ï', 'ð', 'ò', 'ó', 'ô', 'õ', 'ö', 'ø',
+    'ù', 'ú', 'Ý', 'þ', 'ÿ', '¡', '¢', '£', '¤', '¥',
+    '¦', '§', '¨', '©', 'ª', '«', '¬', '®', '¯', '°',
+    '±', '²', '³', '´', 'µ', '¶', '·', '¸', '¹', 'º',
+    '»', '¼', '½', '¾', '¿', 'À', 'Á', 'Â', 'Ã', 'Ä'
+])
+
+# ASCII special characters that indicate corruption when frequent
+_SUSPICIOUS_ASCII_CHARS = frozenset('#$%&*+/<=>@\\^`|~')
+
+_CID_RE = re.compile(r'\(cid:\d+\)')
+_KNOWN_CORRUPTED_RE = re.compile('[' + ''.join(re.escape(c) for c in sorted(_KNOWN_CORRUPTED_CHARS)) + ']')
+# "#$%&#'()#*+"-style runs
+_CONSECUTIVE_SPECIAL_RE = re.compile(r'[#$%&*+/<=>@\\^`|~]{3,}')
+_MIXED_SPECIAL_RE = re.compile(r'(?:[#$%&*+/<=>@\\^`|~\'\"()]+){5,}')
+# Characters counted towards the corruption ratio, in one C-level scan:
+# - suspicious ASCII specials
+# - known corrupted Latin-1 Supplement letters (U+00C0-U+00FF)
+# - any other non-ASCII char outside Hangul, CJK and Latin-1 Supplement
+_RATIO_CHARS_RE = re.compile(
+    '[' + ''.join(re.escape(c) for c in sorted(_SUSPICIOUS_ASCII_CHARS)) + ''.join(
+        re.escape(c) for c in sorted(_KNOWN_CORRUPTED_CHARS) if '\u00C0' <= c <= '\u00FF'
+    ) + ']'
+    '|[^\u0000-\u007F\u00C0-\u00FF\uAC00-\uD7A3\u1100-\u11FF\u3131-\u318E\u4E00-\u9FFF]'
+)
+# ASCII-only samples: deleting the suspicious chars and comparing lengths counts them
+_SUSPICIOUS_DEL = str.maketrans('', '', ''.join(sorted(_SUSPICIOUS_ASCII_CHARS)))
+
+
+class _IgnoringWarningCounter(logging.Handler):
+    """Count pdfminer "Ignoring ..." warnings logged by the creating thread"""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.thread_id = threading.get_ident()
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Other threads may be checking other pages at the same time
+        if record.thread == self.thread_id and "Ignoring" in record.getMessage():
+            self.count += 1
+
+
+def check_pdf_corruption_with_pdfminer(
+    pdf_path: Union[str, BinaryIO],
+    page_num: int,
+    file_key: Optional[tuple] = None
+) -> Tuple[bool, int]:
     """
     Check PDF structure corruption with pdfminer.six
 
-    PDF is considered corrupted if pdfminer issues "Ignoring wrong pointing object" warnings
+    PDF is considered corrupted if pdfminer issues "Ignoring wrong pointing object" warnings.
+    Results are cached per (file, mtime, size, page): for file paths the key
+    comes from os.stat, for streams only when file_key is given.
 
     Args:
-        pdf_path: PDF file path
+        pdf_path: PDF file path or binary stream (e.g. BytesIO over the file contents)
         page_num: Page number (1-indexed)
+        file_key: (path, mtime_ns, size) of the file a stream was read from
 
     Returns:
         (is_corrupted, warning_count)
     """
-    # Capture stderr using thread-safe contextlib
-    captured_stderr = io.StringIO()
+    if file_key is None and isinstance(pdf_path, str):
+        try:
+            st = os.stat(pdf_path)
+            file_key = (pdf_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+
+    if file_key is None:
+        return _check_pdf_corruption_uncached(pdf_path, page_num)
+
+    key = (*file_key, page_num)
+    with _pdfminer_cache_lock:
+        cached = _pdfminer_cache.get(key)
+        if cached is not None:
+            _pdfminer_cache.move_to_end(key)
+            return cached
+
+    result = _check_pdf_corruption_uncached(pdf_path, page_num)
+    with _pdfminer_cache_lock:
+        _pdfminer_cache[key] = result
+        if len(_pdfminer_cache) > PDFMINER_CACHE_SIZE:
+            _pdfminer_cache.popitem(last=False)  # Evict least recently used
+    return result
+
+
+def _check_pdf_corruption_uncached(pdf_path: Union[str, BinaryIO], page_num: int) -> Tuple[bool, int]:
+    """Run the pdfminer warning count for check_pdf_corruption_with_pdfminer"""
+    # Deferred: keeps server start-up light
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.utils import open_filename
+
+    # Count "Ignoring" warnings as log records (no process-wide stderr swap,
+    # so pages can be checked concurrently)
+    counter = _IgnoringWarningCounter()
+    pdfminer_logger = logging.getLogger('pdfminer')
+    pdfminer_logger.addHandler(counter)
 
     try:
-        with redirect_stderr(captured_stderr):
-            # Attempt text extraction with pdfminer
-            extract_text(pdf_path, page_numbers=[page_num - 1])
+        # Interpret the page like extract_text() does, but without layout analysis
+        # (laparams=None): only the warnings matter, the text is never used.
+        # (extract_text(laparams=None) would still fall back to default LAParams)
+        with open_filename(pdf_path, "rb") as fp:
+            rsrcmgr = PDFResourceManager(caching=True)
+            device = PDFPageAggregator(rsrcmgr, laparams=None)
+            interpreter = PDFPageInterpreter(rsrcmgr, device)
+            for page in PDFPage.get_pages(fp, pagenos={page_num - 1}):
+                interpreter.process_page(page)
     except Exception as e:
         logger.debug(f"PDF text extraction failed for {pdf_path} page {page_num}: {e}")
+    finally:
+        pdfminer_logger.removeHandler(counter)
 
-    warnings = captured_stderr.getvalue()
-
-    # Count "Ignoring" warnings
-    warning_count = warnings.count("Ignoring")
+    warning_count = counter.count
 
     # Consider corrupted if 3 or more warnings
     is_corrupted = warning_count >= 3
@@ -67,91 +172,69 @@ def is_text_corrupted(text: str, threshold: float = None) -> Tuple[bool, float]:
     # Use config value if threshold not explicitly provided
     if threshold is None:
         threshold = config.corruption_threshold
-    if not text or len(text.strip()) == 0:
+    if not text or text.isspace():  # isspace() stops at the first visible char (no strip copy)
         return False, 0.0
 
     # Sample for inspection (first 500 characters)
-    sample = text[:500]
-    sample_len = len(sample)
+    sample = text[:CORRUPTION_SAMPLE_CHARS]
 
-    if sample_len == 0:
+    if len(sample) == 0:
         return False, 0.0
 
+    return _is_sample_corrupted(sample, threshold)
+
+
+def _has_matches(pattern: "re.Pattern[str]", text: str, count: int) -> bool:
+    """True if pattern matches at least `count` times (stops at that match, no list built)"""
+    for found, _ in enumerate(pattern.finditer(text), 1):
+        if found >= count:
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_sample_corrupted(sample: str, threshold: float) -> Tuple[bool, float]:
+    """
+    Corruption check on the leading text sample (cached on the sample itself)
+
+    Args:
+        sample: Non-empty text sample (at most CORRUPTION_SAMPLE_CHARS)
+        threshold: Corruption detection threshold (0.0-1.0)
+
+    Returns:
+        (is_corrupted, corruption_ratio)
+    """
+    sample_len = len(sample)
+
     # 1. Check (cid:xxx) pattern (immediately consider corrupted)
-    cid_pattern = re.findall(r'\(cid:\d+\)', sample)
-    if len(cid_pattern) > 3:  # 3 or more cid patterns
+    if _has_matches(_CID_RE, sample, 4):  # More than 3 cid patterns
         return True, 1.0
 
+    # Plain ASCII (the common case) cannot contain known corrupted or non-ASCII chars
+    ascii_only = sample.isascii()
+
     # 2. Known corrupted character patterns
-    known_corrupted_chars = set([
-        '‹', 'Œ', 'Ù', 'Ú', 'Û', 'Ü', 'ñ', 'û', 'ý', 'Þ',
-        'Å', 'Æ', 'Ç', 'È', 'É', 'Ê', 'Ë', 'Î', 'Ï',
-        'Ñ', 'Ò', 'Ó', 'Ô', 'Õ', 'Ö', 'ß', 'à', 'á', 'â',
-        'ã', 'ä', 'å', 'æ', 'ç', 'è', 'é', 'ê', 'ë', 'ì',
-        'í', 'î', 'ï', 'ð', 'ò', 'ó', 'ô', 'õ', 'ö', 'ø',
-        'ù', 'ú', 'Ý', 'þ', 'ÿ', '¡', '¢', '£', '¤', '¥',
-        '¦', '§', '¨', '©', 'ª', '«', '¬', '®', '¯', '°',
-        '±', '²', '³', '´', 'µ', '¶', '·', '¸', '¹', 'º',
-        '»', '¼', '½', '¾', '¿', 'À', 'Á', 'Â', 'Ã', 'Ä'
-    ])
-
-    known_corrupted_count = sum(1 for c in sample if c in known_corrupted_chars)
-
-    if known_corrupted_count > sample_len * 0.05:  # 5% or more
-        return True, known_corrupted_count / sample_len
+    if not ascii_only:
+        known_corrupted_count = len(_KNOWN_CORRUPTED_RE.findall(sample))
+
+        if known_corrupted_count > sample_len * 0.05:  # 5% or more
+            return True, known_corrupted_count / sample_len
 
     # 2.5. Check consecutive special character patterns
     # Patterns like "#$%&#'()#*+" indicate corrupted text
-    consecutive_special = re.findall(r'[#$%&*+/<=>@\\^`|~]{3,}', sample)
-    if len(consecutive_special) >= 3:  # 3 or more occurrences of 3+ consecutive special chars
+    if _has_matches(_CONSECUTIVE_SPECIAL_RE, sample, 3):  # 3 or more occurrences of 3+ consecutive special chars
         return True, 0.8
 
     # Also check mixed special char sequences (e.g., "#'()#*+")
-    mixed_special = re.findall(r'(?:[#$%&*+/<=>@\\^`|~\'\"()]+){5,}', sample)
-    if len(mixed_special) >= 2:  # 2 or more occurrences of 5+ mixed special chars
+    if _has_matches(_MIXED_SPECIAL_RE, sample, 2):  # 2 or more occurrences of 5+ mixed special chars
         return True, 0.7
 
     # 3. Check general special character ratio
-    corrupted_chars = 0
-    valid_chars = set('.,!?()[]{}"\'\n\t -:;')  # Allowed punctuation
-    # ASCII special characters that indicate corruption when frequent
-    suspicious_ascii = set('#$%&*+/<=>@\\^`|~')
-
-    for char in sample:
-        char_code = ord(char)
-
-        # ASCII range
-        if char_code <= 127:
-            # Count suspicious special characters
-            if char in suspicious_ascii:
-                corrupted_chars += 1
-            continue
-
-        # Korean ranges
-        if '\uAC00' <= char <= '\uD7A3':  # Hangul syllables
-            continue
-        if '\u1100' <= char <= '\u11FF':  # Hangul jamo
-            continue
-        if '\u3131' <= char <= '\u318E':  # Hangul compatibility jamo
-            continue
-
-        # Chinese characters
-        if '\u4E00' <= char <= '\u9FFF':
-            continue
-
-        # General European characters (normal range only)
-        if '\u00C0' <= char <= '\u00FF':  # Latin-1 Supplement
-            # But count if it's a known corrupted character
-            if char in known_corrupted_chars:
-                corrupted_chars += 1
-            continue
-
-        # Allowed special characters
-        if char in valid_chars:
-            continue
-
-        # Rest are suspicious characters
-        corrupted_chars += 1
+    # Korean, Chinese, plain ASCII and ordinary Latin-1 letters are fine
+    if ascii_only:
+        corrupted_chars = sample_len - len(sample.translate(_SUSPICIOUS_DEL))
+    else:
+        corrupted_chars = len(_RATIO_CHARS_RE.findall(sample))
 
     # Calculate corruption ratio
     corruption_ratio = corrupted_chars / sample_len
@@ -162,6 +245,12 @@ def is_text_corrupted(text: str, threshold: float = None) -> Tuple[bool, float]:
     return is_corrupted, corruption_ratio
 
 
+def clear_caches() -> None:
+    """Drop cached corruption results (pdfminer checks and text samples)"""
+    with _pdfminer_cache_lock:
+        _pdfminer_cache.clear()
+    _is_sample_corrupted.cache_clear()
+
 
 def get_corruption_message(corruption_ratio: float) -> str:
     """
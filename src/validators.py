@@ -2,120 +2,347 @@
 Validation logic for PDF MCP server
 Enforces page and image limits with intelligent error messages
 """
-import pikepdf
-from typing import Optional
+import bisect
+import itertools
+import os
+from collections import OrderedDict
+from typing import Optional, Sequence
 from .schemas import ValidationResult, SuggestedRange
 from .config import config
 
+# Page count, per-page image counts and per-page image stream bytes per file version
+# (path, mtime, size), least recently used first. Per-page values start as None and
+# are filled in as ranges are validated, so repeated reads of a file skip
+# re-parsing it with pikepdf.
+PDF_SCAN_CACHE_SIZE = 32
+_scan_cache: "OrderedDict[tuple, tuple[int, list, list]]" = OrderedDict()
 
-def validate_pdf_read_request(
-    pdf_path: str,
+# Validation results per (file version, page range, limits), least recently used first
+VALIDATION_CACHE_SIZE = 1024
+_validation_cache: "OrderedDict[tuple, ValidationResult]" = OrderedDict()
+
+# Readers accept the %PDF- header anywhere in the first 1 KB (BOMs, junk prefixes)
+PDF_HEADER_SEARCH_BYTES = 1024
+
+
+def _has_pdf_header(pdf_path: str) -> bool:
+    """Check for the %PDF- header near the start of the file (no PDF parsing)"""
+    with open(pdf_path, 'rb') as f:
+        return b'%PDF-' in f.read(PDF_HEADER_SEARCH_BYTES)
+
+
+class _LazyPdf:
+    """
+    pikepdf document opened on first use (fully cached scans never parse the file)
+
+    The document is memory-mapped, so it must never outlive the
+    validate_pdf_read_request call that opened it: a mapping kept across
+    calls faults (SIGBUS) once the file is truncated or replaced on disk.
+    """
+
+    def __init__(self, file_key: tuple):
+        self.file_key = file_key
+        self.pdf_path = file_key[0]
+        self._doc = None
+
+    @property
+    def doc(self):
+        if self._doc is None:
+            import pikepdf  # Deferred: keeps server start-up light
+            # Read-only handle closed before validation returns: map the file
+            # instead of reading it through a stream
+            self._doc = pikepdf.open(self.pdf_path, access_mode=pikepdf.AccessMode.mmap)
+        return self._doc
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+
+def _fast_page_count(doc) -> int:
+    """
+    Page count from /Count of the page tree root (no page tree walk)
+
+    Like most PDF tools, trusts the root /Count; only a missing or implausible
+    value (negative, or more pages than the file has objects) falls back to
+    len(doc.pages), which builds qpdf's page list.
+
+    Args:
+        doc: Opened pikepdf.Pdf
+
+    Returns:
+        Number of pages
+    """
+    try:
+        count = int(doc.Root.Pages.Count)
+        if 0 <= count < int(doc.trailer.Size):
+            return count
+    except Exception:
+        pass
+    return len(doc.pages)
+
+
+def _get_scan(pdf: _LazyPdf, file_key: tuple) -> tuple[int, list, list]:
+    """Return the cached (total_pages, image_counts, image_bytes) of a file version, creating it on a miss"""
+    scan = _scan_cache.get(file_key)
+    if scan is not None:
+        _scan_cache.move_to_end(file_key)
+        return scan
+
+    total_pages = _fast_page_count(pdf.doc)
+    scan = (total_pages, [None] * total_pages, [None] * total_pages)
+    _scan_cache[file_key] = scan
+    if len(_scan_cache) > PDF_SCAN_CACHE_SIZE:
+        _scan_cache.popitem(last=False)  # Evict least recently used
+    return scan
+
+
+def _fill_image_counts(pdf: _LazyPdf, image_counts: list, first: int, last: int) -> None:
+    """
+    Count images on pages first..last-1 (0-indexed) that are not counted yet
+
+    Args:
+        pdf: Lazily opened document
+        image_counts: Per-page image counts of the document (None = not counted)
+        first: First page index
+        last: Page index after the last page
+    """
+    if None not in image_counts[first:last]:
+        return
+
+    pages = pdf.doc.pages
+    # Pages that /Count claims but the page tree lacks hold no images
+    page_last = min(last, len(pages))
+    for page_index in range(max(first, page_last), last):
+        image_counts[page_index] = 0
+
+    # One slice over the page list instead of an index lookup per page
+    for page_index, page in enumerate(pages[first:page_last], first):
+        if image_counts[page_index] is None:
+            image_counts[page_index] = len(page.images)
+
+
+def _stream_length(image) -> int:
+    """Stored (still compressed) size of an image XObject from its /Length"""
+    try:
+        return int(image.get('/Length', 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _fill_image_bytes(pdf: _LazyPdf, image_bytes: list, first: int, last: int) -> None:
+    """
+    Sum image stream sizes on pages first..last-1 (0-indexed) not summed yet
+
+    Reads /Length from the image dictionaries only; nothing is decoded.
+
+    Args:
+        pdf: Lazily opened document
+        image_bytes: Per-page image stream bytes of the document (None = not summed)
+        first: First page index
+        last: Page index after the last page
+    """
+    if None not in image_bytes[first:last]:
+        return
+
+    pages = pdf.doc.pages
+    # Pages that /Count claims but the page tree lacks hold no images
+    page_last = min(last, len(pages))
+    for page_index in range(max(first, page_last), last):
+        image_bytes[page_index] = 0
+
+    for page_index, page in enumerate(pages[first:page_last], first):
+        if image_bytes[page_index] is None:
+            image_bytes[page_index] = sum(_stream_length(image) for image in page.images.values())
+
+
+def _validate_file(
+    pdf: _LazyPdf,
+    file_key: tuple,
     start_page: int,
     end_page: Optional[int]
 ) -> ValidationResult:
     """
-    Validate PDF read request against page and image limits
+    Validate a request against one version of the file (result is cacheable)
 
-    Pre-scans PDF to count pages and images before processing.
-    Returns validation result with error details and suggested ranges if limits exceeded.
+    OS and PDF parsing errors propagate to validate_pdf_read_request.
 
     Args:
-        pdf_path: Path to PDF file
+        pdf: Lazily opened document
+        file_key: (path, mtime_ns, size) of the file
         start_page: Start page (1-indexed)
         end_page: End page (1-indexed, None = last page)
 
     Returns:
         ValidationResult with validation status and suggestions
     """
-    try:
-        # Open PDF
-        doc = pikepdf.open(pdf_path)
-        total_pages = len(doc.pages)
+    pdf_path = pdf.pdf_path
 
-        # Validate page range exists
-        if start_page > total_pages:
-            doc.close()
-            return ValidationResult(
-                valid=False,
-                error="INVALID_PAGE_RANGE",
-                message=(
-                    f"Start page ({start_page}) is out of document range. "
-                    f"This document has {total_pages} pages. "
-                    f"Please request pages between 1-{total_pages}."
-                ),
-                total_pages=total_pages
-            )
+    # Non-PDF and empty files fail here, before pikepdf allocates anything
+    if not _has_pdf_header(pdf_path):
+        return ValidationResult(
+            valid=False,
+            error="INVALID_PDF",
+            message=f"Not a PDF file (no %PDF- header): {pdf_path}"
+        )
 
-        if end_page is not None and end_page < start_page:
-            doc.close()
-            return ValidationResult(
-                valid=False,
-                error="INVALID_PAGE_RANGE",
-                message=(
-                    f"End page ({end_page}) is less than start page ({start_page}). "
-                    f"This document has {total_pages} pages. "
-                    f"Please request a valid range (e.g., {start_page}-{min(start_page + 9, total_pages)})."
-                ),
-                total_pages=total_pages
-            )
+    # Page count (and image counts below) come from the scan cache when
+    # this version of the file was validated before
+    total_pages, image_counts, image_bytes = _get_scan(pdf, file_key)
 
-        # Automatically adjust end_page if it exceeds document range
-        # Example: 15-page document with request 10-19 → auto-adjust to 10-15
-        actual_end = min(end_page or total_pages, total_pages)
-        page_count = actual_end - start_page + 1
+    max_pages = config.max_pages_per_request
+    max_images = config.max_images_per_request
 
-        # Validate page count
-        max_pages = config.max_pages_per_request
-        max_images = config.max_images_per_request
+    # Validate page range exists
+    if start_page > total_pages:
+        return ValidationResult(
+            valid=False,
+            error="INVALID_PAGE_RANGE",
+            message=(
+                f"Start page ({start_page}) is out of document range. "
+                f"This document has {total_pages} pages. "
+                f"Please request pages between 1-{total_pages}."
+            ),
+            total_pages=total_pages
+        )
 
-        if page_count > max_pages:
-            suggested_ranges = calculate_suggested_ranges(
-                doc, start_page, actual_end,
-                max_pages, max_images
-            )
-            doc.close()
-            return ValidationResult(
-                valid=False,
-                error="PAGE_LIMIT_EXCEEDED",
-                message=(
-                    f"Requested page count ({page_count}) exceeds the limit ({max_pages}). "
-                    f"This document has {total_pages} pages. "
-                    f"Please read in multiple batches using the suggested ranges or invoke a separate agent."
-                ),
-                total_pages=total_pages,
-                suggested_ranges=suggested_ranges
-            )
+    if end_page is not None and end_page < start_page:
+        # Example range: the first suggestion from start_page (within both limits)
+        example_end = min(start_page + max_pages - 1, total_pages)
+        _fill_image_counts(pdf, image_counts, start_page - 1, example_end)
+        suggestions = calculate_suggested_ranges(image_counts, start_page, example_end, max_pages, max_images)
+        # No suggestions (e.g. max_suggested_ranges=0): the page-limited range itself
+        if suggestions:
+            example_start, example_end = suggestions[0].start_page, suggestions[0].end_page
+        else:
+            example_start = start_page
+        return ValidationResult(
+            valid=False,
+            error="INVALID_PAGE_RANGE",
+            message=(
+                f"End page ({end_page}) is less than start page ({start_page}). "
+                f"This document has {total_pages} pages. "
+                f"Please request a valid range (e.g., {example_start}-{example_end})."
+            ),
+            total_pages=total_pages
+        )
 
-        # Count images in range
-        total_images = 0
-        for page_num in range(start_page - 1, actual_end):
-            if page_num >= total_pages:
-                break
-            page = doc.pages[page_num]
-            total_images += len(page.images)
-
-        # Validate image count
-        if total_images > max_images:
-            suggested_ranges = calculate_suggested_ranges(
-                doc, start_page, actual_end,
-                max_pages, max_images
-            )
-            doc.close()
+    # Automatically adjust end_page if it exceeds document range
+    # Example: 15-page document with request 10-19 → auto-adjust to 10-15
+    actual_end = min(end_page or total_pages, total_pages)
+    page_count = actual_end - start_page + 1
+
+    # Validate page count
+    if page_count > max_pages:
+        # Suggestions cover at most max_suggested_ranges ranges of max_pages pages
+        _fill_image_counts(
+            pdf, image_counts, start_page - 1,
+            min(actual_end, start_page - 1 + max_pages * config.max_suggested_ranges)
+        )
+        suggested_ranges = calculate_suggested_ranges(
+            image_counts, start_page, actual_end,
+            max_pages, max_images
+        )
+        return ValidationResult(
+            valid=False,
+            error="PAGE_LIMIT_EXCEEDED",
+            message=(
+                f"Requested page count ({page_count}) exceeds the limit ({max_pages}). "
+                f"This document has {total_pages} pages. "
+                f"Please read in multiple batches using the suggested ranges or invoke a separate agent."
+            ),
+            total_pages=total_pages,
+            suggested_ranges=suggested_ranges
+        )
+
+    # Count images in range
+    _fill_image_counts(pdf, image_counts, start_page - 1, actual_end)
+    total_images = sum(image_counts[start_page - 1:actual_end])
+
+    # Validate image count
+    if total_images > max_images:
+        suggested_ranges = calculate_suggested_ranges(
+            image_counts, start_page, actual_end,
+            max_pages, max_images
+        )
+        return ValidationResult(
+            valid=False,
+            error="IMAGE_LIMIT_EXCEEDED",
+            message=(
+                f"Image count in the requested range ({total_images}) exceeds the limit ({max_images}). "
+                f"Please read in smaller batches using the suggested ranges, select a page range with fewer images, "
+                f"or invoke a separate agent to process."
+            ),
+            total_pages=total_pages,
+            total_images=total_images,
+            suggested_ranges=suggested_ranges
+        )
+
+    # Validate stored image size (catches a few huge images under the count limit)
+    max_image_mb = config.max_image_mb_per_request
+    if max_image_mb > 0 and total_images:
+        _fill_image_bytes(pdf, image_bytes, start_page - 1, actual_end)
+        total_image_mb = sum(image_bytes[start_page - 1:actual_end]) / (1024 * 1024)
+        if total_image_mb > max_image_mb:
             return ValidationResult(
                 valid=False,
                 error="IMAGE_LIMIT_EXCEEDED",
                 message=(
-                    f"Image count in the requested range ({total_images}) exceeds the limit ({max_images}). "
-                    f"Please read in smaller batches using the suggested ranges, select a page range with fewer images, "
-                    f"or invoke a separate agent to process."
+                    f"Image data in the requested range ({total_image_mb:.1f} MB) exceeds the limit ({max_image_mb} MB). "
+                    f"Please read fewer pages at a time, select a page range with fewer images, "
+                    f"or use 'text_only' mode."
                 ),
                 total_pages=total_pages,
-                total_images=total_images,
-                suggested_ranges=suggested_ranges
+                total_images=total_images
             )
 
-        doc.close()
-        return ValidationResult(valid=True)
+    return ValidationResult(valid=True)
+
+
+def validate_pdf_read_request(
+    pdf_path: str,
+    start_page: int,
+    end_page: Optional[int]
+) -> ValidationResult:
+    """
+    Validate PDF read request against page and image limits
+
+    Pre-scans PDF to count pages and images before processing.
+    Returns validation result with error details and suggested ranges if limits exceeded.
+    Results are cached per file version (path, mtime, size), page range and limits.
+
+    Args:
+        pdf_path: Path to PDF file
+        start_page: Start page (1-indexed)
+        end_page: End page (1-indexed, None = last page)
+
+    Returns:
+        ValidationResult with validation status and suggestions
+    """
+    import pikepdf  # Deferred: keeps server start-up light
+
+    pdf = None
+    try:
+        # Repeated requests for the same file version, range and limits
+        st = os.stat(pdf_path)
+        file_key = (pdf_path, st.st_mtime_ns, st.st_size)
+        result_key = (
+            *file_key, start_page, end_page,
+            config.max_pages_per_request, config.max_images_per_request, config.max_suggested_ranges,
+            config.max_image_mb_per_request
+        )
+        result = _validation_cache.get(result_key)
+        if result is not None:
+            _validation_cache.move_to_end(result_key)
+            return result
+
+        pdf = _LazyPdf(file_key)
+        result = _validate_file(pdf, file_key, start_page, end_page)
+        _validation_cache[result_key] = result
+        if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)  # Evict least recently used
+        return result
 
     except FileNotFoundError:
         return ValidationResult(
@@ -135,16 +362,20 @@ def validate_pdf_read_request(
             error="INVALID_PDF",
             message=f"Invalid or corrupted PDF file: {str(e)}"
         )
-    except Exception as e:
+    except (OSError, ValueError) as e:
+        # Anything unexpected propagates to read_pdf_handler, which reports it
         return ValidationResult(
             valid=False,
             error="INVALID_PDF",
             message=f"PDF file validation failed: {str(e)}"
         )
+    finally:
+        if pdf is not None:
+            pdf.close()
 
 
 def calculate_suggested_ranges(
-    doc: pikepdf.Pdf,
+    image_counts: Sequence[int],
     start_page: int,
     end_page: int,
     max_pages: int,
@@ -159,7 +390,8 @@ def calculate_suggested_ranges(
     3. Account for image density variations
 
     Args:
-        doc: Opened pikepdf.Pdf
+        image_counts: Image count of every page (0-indexed), counted at least
+            for the pages of the suggested ranges
         start_page: Start page (1-indexed)
         end_page: End page (1-indexed)
         max_pages: Maximum pages per range
@@ -170,44 +402,46 @@ def calculate_suggested_ranges(
     """
     ranges = []
     current_start = start_page
-    total_doc_pages = len(doc.pages)
+    max_ranges = config.max_suggested_ranges  # Read once, not per loop iteration
+    # Suggestions never reach past max_ranges full ranges
+    last_page = min(end_page, len(image_counts), start_page - 1 + max_pages * max_ranges)
 
-    while current_start <= end_page and len(ranges) < config.max_suggested_ranges:
-        # Start with max allowed pages
-        current_end = min(current_start + max_pages - 1, end_page)
-        current_images = 0
-        final_end = current_start  # Track last valid page
-
-        # Count images and adjust end if needed
-        for page_num in range(current_start - 1, current_end):
-            if page_num >= total_doc_pages:
-                break
-
-            page = doc.pages[page_num]
-            page_images = len(page.images)
-
-            # Check if adding this page would exceed image limit
-            if current_images + page_images > max_images:
-                # If we haven't added any pages yet, include at least this one
-                if page_num == current_start - 1:
-                    current_images += page_images
-                    final_end = page_num + 1
-                else:
-                    # Stop before this page
-                    final_end = page_num
-                break
-
-            current_images += page_images
-            final_end = page_num + 1
-
-        # Add range if valid
-        if final_end >= current_start:
+    # prefix[i] = images on the first i pages from start_page (non-decreasing, so
+    # the longest range within the image limit is found by bisection)
+    prefix = [0, *itertools.accumulate(image_counts[start_page - 1:last_page])]
+
+    # Few images overall (the common case): no range can hit the image limit,
+    # so the ranges are plain max_pages chunks
+    if prefix[-1] <= max_images:
+        for range_start in range(start_page, last_page + 1, max_pages)[:max_ranges]:
+            range_end = min(range_start + max_pages - 1, last_page)
             ranges.append(SuggestedRange(
-                start_page=current_start,
-                end_page=final_end,
-                estimated_images=current_images,
-                page_count=final_end - current_start + 1
+                start_page=range_start,
+                end_page=range_end,
+                estimated_images=prefix[range_end - start_page + 1] - prefix[range_start - start_page],
+                page_count=range_end - range_start + 1
             ))
+        return ranges
+
+    while current_start <= last_page and len(ranges) < max_ranges:
+        offset = current_start - start_page
+        # Start with max allowed pages
+        current_end = min(current_start + max_pages - 1, last_page)
+
+        # Last page keeping the range within max_images
+        # (a single page over the limit still forms its own range)
+        fit = bisect.bisect_right(
+            prefix, prefix[offset] + max_images, offset + 1, current_end - start_page + 2
+        ) - 1
+        final_end = start_page - 1 + max(fit, offset + 1)
+        current_images = prefix[final_end - start_page + 1] - prefix[offset]
+
+        ranges.append(SuggestedRange(
+            start_page=current_start,
+            end_page=final_end,
+            estimated_images=current_images,
+            page_count=final_end - current_start + 1
+        ))
 
         # Move to next range
         current_start = final_end + 1
@@ -0,0 +1,255 @@
+async function listPDFs() {
+    const output = document.getElementById('pdf-list-output');
+    output.innerHTML = '<div class="loading">Loading PDFs...</div>';
+
+    try {
+        const response = await fetch('/api/list_pdfs', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                working_directory: document.getElementById('workdir').value || '.'
+            })
+        });
+
+        const result = await response.json();
+
+        if (result.error) {
+            output.innerHTML = `<div class="error">${result.error}: ${result.message}</div>`;
+        } else if (result.pdfs && result.pdfs.length > 0) {
+            const pdfItems = result.pdfs.map(pdf => `
+                <div class="pdf-item">
+                    <div class="pdf-info">
+                        <div class="pdf-name">${escapeHtml(pdf.name)}</div>
+                        <div class="pdf-meta">
+                            ${pdf.pages} pages •
+                            ${(pdf.size_bytes / 1024).toFixed(1)} KB •
+                            ${escapeHtml(pdf.path)}
+                        </div>
+                    </div>
+                    <div class="action-buttons">
+                        <button class="btn-list" onclick="selectFile('${escapeHtml(pdf.path)}')">
+                            Select
+                        </button>
+                        <button class="btn-run" onclick="quickRead('${escapeHtml(pdf.path)}')">
+                            Read
+                        </button>
+                    </div>
+                </div>
+            `).join('');
+
+            output.innerHTML = `
+                <div style="margin-bottom: 10px; color: #666; font-size: 14px;">
+                    Found ${result.total_count} PDF(s) in ${escapeHtml(result.working_directory)}
+                </div>
+                <div class="pdf-list">${pdfItems}</div>
+            `;
+        } else {
+            output.innerHTML = '<div style="color: #666;">No PDFs found</div>';
+        }
+    } catch (error) {
+        output.innerHTML = `<div class="error">Error: ${escapeHtml(error.message)}</div>`;
+    }
+}
+
+// Rendering appends HTML fragments to one shared array; the caller joins it
+// once and assigns innerHTML once (no per-page/per-block intermediate strings)
+function renderContentBlock(block, parts) {
+    if (block.type === 'text') {
+        parts.push(
+            '<div class="content-block block-text">',
+            '<span class="block-type-label label-text">Text</span>',
+            '<div>', escapeHtml(block.content), '</div>',
+            '</div>'
+        );
+    } else if (block.type === 'table') {
+        // Table HTML is rendered by the server
+        parts.push(
+            '<div class="content-block block-table">',
+            '<span class="block-type-label label-table">Table</span>',
+            block.html,
+            '</div>'
+        );
+    } else if (block.type === 'image') {
+        parts.push(
+            '<div class="content-block block-image">',
+            '<span class="block-type-label label-image">Image</span>',
+            `<img src="${block.content}" alt="Extracted image">`,
+            '</div>'
+        );
+    }
+}
+
+function renderPage(page, parts) {
+    parts.push(
+        '<div class="page-container">',
+        '<div class="page-header">',
+        `<span>Page ${page.page_number}</span>`,
+        `<span>${page.content_blocks.length} block(s)</span>`,
+        '</div>',
+        '<div class="page-content">'
+    );
+
+    if (page.text_corrupted) {
+        parts.push(
+            '<div class="corruption-warning">',
+            '<strong>Text Corruption Detected</strong>',
+            ` (${(page.corruption_ratio * 100).toFixed(1)}% corruption ratio)`,
+            ' - Page image provided for vision analysis',
+            '</div>'
+        );
+    }
+
+    if (page.text_hint) {
+        parts.push(
+            '<div class="text-hint-info">',
+            `<strong>Text Available:</strong> ${page.text_hint}`,
+            '</div>'
+        );
+    }
+
+    const blocksStart = parts.length;
+    for (const block of page.content_blocks) {
+        renderContentBlock(block, parts);
+    }
+    const hasBlocks = parts.length > blocksStart;
+
+    if (page.page_image) {
+        parts.push(
+            '<div class="page-image-container">',
+            '<div style="font-weight: 600; margin-bottom: 10px; color: #666;">',
+            `Full Page Image (${page.page_image_width}x${page.page_image_height}px)`,
+            '</div>',
+            `<img src="${page.page_image}" alt="Page ${page.page_number}">`,
+            '</div>'
+        );
+    }
+
+    // Empty page message if no content
+    if (!hasBlocks && !page.page_image && !page.text_corrupted) {
+        parts.push(
+            '<div style="color: #888; font-style: italic; padding: 20px; text-align: center;">',
+            'This page has no extractable content (no text, tables, or images)',
+            '</div>'
+        );
+    }
+
+    parts.push('</div>', '</div>');
+}
+
+async function readPDF() {
+    const filepath = document.getElementById('filepath').value;
+    if (!filepath) {
+        alert('Please enter a PDF file path');
+        return;
+    }
+
+    const output = document.getElementById('read-output');
+    output.innerHTML = '<div class="loading">Reading PDF...</div>';
+
+    try {
+        const body = {
+            file_path: filepath,
+            start_page: parseInt(document.getElementById('startpage').value) || 1,
+            filter_header_footer: document.getElementById('filterheader').value === 'enabled',
+            crop_images: document.getElementById('cropimages').value === 'enabled',
+            extraction_mode: document.getElementById('extractionmode').value
+        };
+
+        const endPage = document.getElementById('endpage').value;
+        if (endPage) {
+            body.end_page = parseInt(endPage);
+        }
+
+        const response = await fetch('/api/read_pdf', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(body)
+        });
+
+        const result = await response.json();
+
+        if (result.error) {
+            output.innerHTML = `<div class="error">${escapeHtml(result.error)}: ${escapeHtml(result.message)}</div>`;
+        } else if (result.pages) {
+            // Render pages with visual content
+            const parts = [
+                '<div class="output">',
+                '<div class="stats">',
+                `<span class="stats-item">${result.total_pages_read} page(s)</span>`,
+                `<span class="stats-item">${result.total_images} image(s)</span>`,
+                `<span class="stats-item">${escapeHtml(result.file_path)}</span>`,
+                '</div>'
+            ];
+            for (const page of result.pages) {
+                renderPage(page, parts);
+            }
+            parts.push('</div>');
+            output.innerHTML = parts.join('');
+        } else {
+            output.innerHTML = `<div class="output"><pre>${JSON.stringify(result, null, 2)}</pre></div>`;
+        }
+    } catch (error) {
+        output.innerHTML = `<div class="error">Error: ${escapeHtml(error.message)}</div>`;
+    }
+}
+
+function selectFile(filepath) {
+    document.getElementById('filepath').value = filepath;
+}
+
+function quickRead(filepath) {
+    document.getElementById('filepath').value = filepath;
+    readPDF();
+}
+
+// Plain string replacement: no throwaway DOM element per escaped string
+const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+
+function escapeHtml(text) {
+    return String(text ?? '').replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+}
+
+const MODE_DESCRIPTIONS = {
+    'auto': {
+        title: 'Auto Mode (Default)',
+        content: 'Extracts text, tables, and images normally. If text corruption is detected, automatically <strong>blocks corrupted text</strong> and provides page image for vision analysis. Best for general use.'
+    },
+    'text_only': {
+        title: 'Text Only Mode',
+        content: 'Extracts text, tables, and document images only. <strong>Never includes page images</strong>, even if text is corrupted. Fastest mode with minimal tokens. Best for known good PDFs.'
+    },
+    'image_only': {
+        title: 'Image Only Mode',
+        content: 'Skips all text extraction entirely. Provides <strong>only full page images</strong> for vision analysis. Best for scanned documents or known corrupted text.'
+    }
+};
+
+// Elements updateModeInfo touches, looked up once on page load
+let modeElements = null;
+
+function updateModeInfo() {
+    const {mode, modeInfo, cropImages} = modeElements;
+    const selected = mode.value;
+
+    const info = MODE_DESCRIPTIONS[selected];
+    modeInfo.innerHTML = `
+        <div class="mode-info-title">${info.title}</div>
+        <div class="mode-info-content">${info.content}</div>
+    `;
+
+    // Disable Cropping option in image_only mode (not applicable to page images)
+    const isImageOnly = (selected === 'image_only');
+    cropImages.disabled = isImageOnly;
+    cropImages.parentElement.classList.toggle('option-disabled', isImageOnly);
+}
+
+// Auto-load PDFs on page load
+window.onload = () => {
+    modeElements = {
+        mode: document.getElementById('extractionmode'),
+        modeInfo: document.getElementById('mode-info'),
+        cropImages: document.getElementById('cropimages')
+    };
+    listPDFs();
+    updateModeInfo();
+};
@@ -2,14 +2,20 @@
 """Test image extraction directly without MCP"""
 import asyncio
 import json
-import sys
-from pathlib import Path
-
-# Add project to path
-sys.path.insert(0, str(Path(__file__).parent))
 
+# The script's directory (project root) is already first on sys.path
 from src.pdf_tools import read_pdf_handler
 
+try:
+    import uvloop  # Optional: faster event loop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
 async def main():
     print("Testing page 10 image extraction...")
     result_json, images = await read_pdf_handler({
@@ -19,7 +25,7 @@ async def main():
         'extraction_mode': 'auto'
     })
 
-    result = json.loads(result_json)
+    result = orjson.loads(result_json) if orjson is not None else json.loads(result_json)
 
     print("\n=== JSON Response ===")
     print(f"Total images in JSON: {result.get('total_images', 0)}")
@@ -45,4 +51,7 @@ async def main():
         print(f"\nSUCCESS: {len(images)} images extracted")
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures
+"""
+from pathlib import Path
+
+import pytest
+
+
+def _write_text_pdf(path: Path, lines: list[str]) -> None:
+    """Write a one-page PDF showing each string on its own line (Helvetica, ASCII only)"""
+    text_ops = " T* ".join(f"({line}) Tj" for line in lines)
+    content = f"BT /F1 12 Tf 36 TL 72 720 Td {text_ops} ET".encode("ascii")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+    ]
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    path.write_bytes(bytes(data))
+
+
+@pytest.fixture
+def make_text_pdf(tmp_path):
+    """Factory writing tmp_path/name as a one-page PDF with the given text lines"""
+    def make(name: str, lines: list[str]) -> Path:
+        path = tmp_path / name
+        _write_text_pdf(path, lines)
+        return path
+    return make
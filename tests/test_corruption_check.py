@@ -0,0 +1,75 @@
+"""
+Tests for when read_pdf consults the pdfminer structure check.
+
+The character-based check runs first; pdfminer's "Ignoring ..." warning
+count only decides pages whose characters are not clearly clean:
+1. Clean text (ratio at most half the threshold) → pdfminer not consulted,
+   page not flagged even if pdfminer would report warnings
+2. Too little text to judge → pdfminer consulted, its verdict flags the page
+3. text_only mode → pdfminer never consulted
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import pdf_tools
+from src.pdf_tools import read_pdf_handler
+
+
+CLEAN_LINES = [
+    "The quick brown fox jumps over the lazy dog",
+    "Pack my box with five dozen liquor jugs",
+]
+
+
+@pytest.fixture
+def pdfminer_calls(monkeypatch, tmp_path) -> list:
+    """pdfminer check that always reports 5 warnings; returns the pages it was asked about"""
+    calls = []
+
+    def fake_check(pdf_stream, page_num, file_key=None):
+        calls.append(page_num)
+        return True, 5
+
+    monkeypatch.setattr(pdf_tools, "check_pdf_corruption_with_pdfminer", fake_check)
+    monkeypatch.chdir(tmp_path)  # read_pdf only reads below the working directory
+    return calls
+
+
+async def _read_page(file_path: Path, mode: str) -> dict:
+    result_json, _ = await read_pdf_handler({"file_path": file_path.name, "extraction_mode": mode})
+    result = json.loads(result_json)
+    assert "error" not in result, result
+    return result["pages"][0]
+
+
+class TestPdfminerGating:
+    """Tests for the pdfminer corruption check gating"""
+
+    @pytest.mark.asyncio
+    async def test_clean_text_skips_pdfminer(self, make_text_pdf, pdfminer_calls):
+        """Clean page text is trusted without the pdfminer re-parse"""
+        page = await _read_page(make_text_pdf("clean.pdf", CLEAN_LINES), "auto")
+
+        assert pdfminer_calls == []
+        assert not page.get("text_corrupted")
+
+    @pytest.mark.asyncio
+    async def test_short_text_uses_pdfminer_verdict(self, make_text_pdf, pdfminer_calls):
+        """Text too short for the character check is judged by pdfminer"""
+        page = await _read_page(make_text_pdf("short.pdf", ["Hi"]), "auto")
+
+        assert pdfminer_calls == [1]
+        assert page["text_corrupted"] is True
+        assert page["corruption_ratio"] == pytest.approx(0.5)  # 5 warnings / 10
+
+    @pytest.mark.asyncio
+    async def test_text_only_never_uses_pdfminer(self, make_text_pdf, pdfminer_calls):
+        """text_only mode renders no page image, so pdfminer is not consulted"""
+        await _read_page(make_text_pdf("short.pdf", ["Hi"]), "text_only")
+
+        assert pdfminer_calls == []
@@ -0,0 +1,40 @@
+"""
+Tests for the pdfgrep locale choice.
+
+Byte-wise (C locale) matching is only used where it cannot change results:
+1. ASCII literal patterns and ASCII fixed strings → C
+2. '.', bracket expressions, backslash escapes → inherited locale
+3. Non-ASCII patterns → inherited locale
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pdf_tools import _grep_locale
+
+
+class TestGrepLocale:
+    """Tests for _grep_locale"""
+
+    @pytest.mark.parametrize("pattern", ["invoice", "total|sum", "^Chapter 1?$", "ab+c"])
+    def test_ascii_literal_regex_uses_c(self, pattern):
+        """Patterns without locale-dependent syntax match byte-wise"""
+        assert _grep_locale(pattern, fixed_strings=False) == "C"
+
+    @pytest.mark.parametrize("pattern", ["r.sum.", "^.{5}$", "[[:alpha:]]+", "[a-z]", r"\w+", r"\bword\b"])
+    def test_locale_dependent_regex_keeps_locale(self, pattern):
+        """'.', bracket expressions and escapes must match characters, not bytes"""
+        assert _grep_locale(pattern, fixed_strings=False) is None
+
+    def test_ascii_fixed_string_uses_c(self):
+        """Fixed strings are literals, even with regex metacharacters in them"""
+        assert _grep_locale("a.b [c]", fixed_strings=True) == "C"
+
+    @pytest.mark.parametrize("fixed_strings", [False, True])
+    def test_non_ascii_keeps_locale(self, fixed_strings):
+        """Non-ASCII patterns (e.g. Korean, accented) keep the inherited locale"""
+        assert _grep_locale("테스트", fixed_strings) is None
+        assert _grep_locale("résumé", fixed_strings) is None
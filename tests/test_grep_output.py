@@ -0,0 +1,53 @@
+"""
+Tests for reading pdfgrep output lines.
+
+Lines longer than the limit are skipped whole, not fatal:
+1. Short lines → yielded without the newline
+2. Overlong line between short ones → skipped, neighbours kept
+3. Overlong line spanning several reads → skipped up to its newline
+4. Last line without a newline → yielded
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import pdf_tools
+from src.pdf_tools import _iter_output_lines
+
+
+async def _lines(data: bytes, max_length: int) -> list[bytes]:
+    stream = asyncio.StreamReader()
+    stream.feed_data(data)
+    stream.feed_eof()
+    return [line async for line in _iter_output_lines(stream, max_length)]
+
+
+class TestIterOutputLines:
+    """Tests for _iter_output_lines"""
+
+    @pytest.mark.asyncio
+    async def test_short_lines(self):
+        """Lines within the limit come back as they are"""
+        assert await _lines(b"a.pdf:1:x\nb.pdf:2:y\n", 100) == [b"a.pdf:1:x", b"b.pdf:2:y"]
+
+    @pytest.mark.asyncio
+    async def test_overlong_line_skipped(self):
+        """An overlong line is dropped; the lines around it are kept"""
+        data = b"a.pdf:1:x\n" + b"a.pdf:2:" + b"z" * 50 + b"\nb.pdf:3:y\n"
+        assert await _lines(data, 20) == [b"a.pdf:1:x", b"b.pdf:3:y"]
+
+    @pytest.mark.asyncio
+    async def test_overlong_line_across_reads(self, monkeypatch):
+        """A line longer than several reads is skipped up to its own newline"""
+        monkeypatch.setattr(pdf_tools, "GREP_READ_CHUNK", 4)
+        data = b"a.pdf:1:" + b"z" * 30 + b"\nb.pdf:2:y\n"
+        assert await _lines(data, 12) == [b"b.pdf:2:y"]
+
+    @pytest.mark.asyncio
+    async def test_last_line_without_newline(self):
+        """Output ending without a newline still yields its last line"""
+        assert await _lines(b"a.pdf:1:x\nb.pdf:2:y", 100) == [b"a.pdf:1:x", b"b.pdf:2:y"]
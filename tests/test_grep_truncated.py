@@ -0,0 +1,85 @@
+"""
+Tests for the grep_pdf truncated flag.
+
+truncated is True only when more matches exist beyond max_count:
+1. Single file, exactly max_count matches → truncated False
+2. Single file, max_count + 1 matches → truncated True
+3. Directory, exactly max_count matches → truncated False
+4. Directory, max_count + 1 matches → truncated True (first files in path order)
+"""
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pdf_tools import grep_pdf_handler
+
+
+@pytest.fixture
+def check_pdfgrep():
+    """Skip tests if pdfgrep is not installed"""
+    if not shutil.which("pdfgrep"):
+        pytest.skip("pdfgrep not installed")
+
+
+@pytest.fixture
+def three_needles(make_text_pdf) -> Path:
+    """PDF with three matching lines"""
+    return make_text_pdf("three.pdf", ["needle one", "filler", "needle two", "filler", "needle three"])
+
+
+@pytest.fixture
+def needle_dir(make_text_pdf) -> Path:
+    """Directory with a.pdf (two matching lines) and b.pdf (one matching line)"""
+    make_text_pdf("a.pdf", ["needle a1", "filler", "needle a2"])
+    return make_text_pdf("b.pdf", ["filler", "needle b1"]).parent
+
+
+async def _grep(**arguments) -> dict:
+    result_json, _ = await grep_pdf_handler({"pattern": "needle", "context": 0, **arguments})
+    result = json.loads(result_json)
+    assert "error" not in result, result
+    return result
+
+
+class TestGrepTruncated:
+    """Tests for grep_pdf truncated at and just past max_count"""
+
+    @pytest.mark.asyncio
+    async def test_single_file_exactly_max_count(self, check_pdfgrep, three_needles):
+        """Single file with exactly max_count matches is not truncated"""
+        result = await _grep(file_path=str(three_needles), max_count=3)
+
+        assert result["total"] == 3
+        assert result["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_single_file_one_past_max_count(self, check_pdfgrep, three_needles):
+        """Single file with max_count + 1 matches is truncated"""
+        result = await _grep(file_path=str(three_needles), max_count=2)
+
+        assert result["total"] == 2
+        assert result["truncated"] is True
+        assert [m["text"].strip() for m in result["matches"]] == ["needle one", "needle two"]
+
+    @pytest.mark.asyncio
+    async def test_directory_exactly_max_count(self, check_pdfgrep, needle_dir):
+        """Directory with exactly max_count matches overall is not truncated"""
+        result = await _grep(working_directory=str(needle_dir), max_count=3)
+
+        assert result["total"] == 3
+        assert result["truncated"] is False
+        assert result["files_searched"] == 2
+
+    @pytest.mark.asyncio
+    async def test_directory_one_past_max_count(self, check_pdfgrep, needle_dir):
+        """Directory with max_count + 1 matches is truncated, keeping the first files' matches"""
+        result = await _grep(working_directory=str(needle_dir), max_count=2)
+
+        assert result["total"] == 2
+        assert result["truncated"] is True
+        assert [Path(m["file"]).name for m in result["matches"]] == ["a.pdf", "a.pdf"]
@@ -0,0 +1,51 @@
+"""
+Tests for crop_image_to_max_dimension output formats.
+
+Resized images keep the format of their source, whichever backend does the
+resize (libvips when pyvips is installed, PIL otherwise):
+1. JPEG source → JPEG
+2. PNG source → PNG
+3. GIF source (not handled by libvips) → GIF
+4. Image that already fits → original bytes
+"""
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.image_processor import crop_image_to_max_dimension
+
+
+def _encode(img_format: str, size: tuple[int, int] = (1200, 600)) -> bytes:
+    """Solid-color test image of the given size in the given PIL format"""
+    mode = 'P' if img_format == 'GIF' else 'RGB'
+    buffer = io.BytesIO()
+    Image.new(mode, size, color=1 if mode == 'P' else (200, 120, 40)).save(buffer, format=img_format)
+    return buffer.getvalue()
+
+
+class TestCropImageFormat:
+    """Tests for the format of resized images"""
+
+    @pytest.mark.parametrize("img_format", ["JPEG", "PNG", "GIF"])
+    def test_resize_keeps_source_format(self, img_format):
+        """Downscaled images are re-encoded in the source format"""
+        data, width, height = crop_image_to_max_dimension(_encode(img_format), 400)
+
+        assert data is not None
+        assert max(width, height) <= 400
+        with Image.open(io.BytesIO(data)) as resized:
+            assert resized.format == img_format
+            assert resized.size == (width, height)
+
+    def test_small_image_returned_unchanged(self):
+        """Images within max_dimension are passed through as is"""
+        original = _encode("PNG", (300, 200))
+        data, width, height = crop_image_to_max_dimension(original, 400)
+
+        assert data == original
+        assert (width, height) == (300, 200)
@@ -0,0 +1,88 @@
+"""
+Tests for list_pdfs listing reuse across calls.
+
+A cached listing is reused only while none of the directories it scanned
+has changed:
+1. Unchanged tree → cached listing reused
+2. File added in a subdirectory → recursive listing includes it
+3. File added in a new nested directory → recursive listing includes it
+"""
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import pdf_tools
+from src.pdf_tools import list_pdfs_handler
+
+
+SAMPLE_PDF_DIR = Path(__file__).parent.parent / "sample_pdfs"
+
+
+@pytest.fixture
+def pdf_tree(tmp_path) -> Path:
+    """root/top.pdf and root/sub/inner.pdf, with directory mtimes a minute in the past"""
+    sample = next(SAMPLE_PDF_DIR.glob("sample*.pdf"), None)
+    if sample is None:
+        pytest.skip("No sample PDFs available")
+    (tmp_path / "sub").mkdir()
+    shutil.copy(sample, tmp_path / "top.pdf")
+    shutil.copy(sample, tmp_path / "sub" / "inner.pdf")
+
+    # Directories modified just before a scan are never cached: age them
+    past_ns = time.time_ns() - 60 * 1_000_000_000
+    for directory in (tmp_path / "sub", tmp_path):
+        os.utime(directory, ns=(past_ns, past_ns))
+    return tmp_path
+
+
+async def _list_names(root: Path) -> list[str]:
+    result_json, _ = await list_pdfs_handler({
+        "working_directory": str(root),
+        "recursive": True
+    })
+    result = json.loads(result_json)
+    assert "error" not in result, result
+    return sorted(pdf["name"] for pdf in result["pdfs"])
+
+
+def _is_cached(root: Path) -> bool:
+    return any(key[0] == str(root.resolve()) for key in pdf_tools._listing_cache)
+
+
+class TestListingCache:
+    """Tests for recursive list_pdfs after directory changes"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tree_is_cached(self, pdf_tree):
+        """A listing of an unchanged tree is kept for reuse"""
+        assert await _list_names(pdf_tree) == ["inner.pdf", "top.pdf"]
+        assert _is_cached(pdf_tree)
+        assert await _list_names(pdf_tree) == ["inner.pdf", "top.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_file_added_in_subdirectory(self, pdf_tree):
+        """A PDF created in a subdirectory shows up on the next recursive listing"""
+        assert await _list_names(pdf_tree) == ["inner.pdf", "top.pdf"]
+        assert _is_cached(pdf_tree)
+
+        # Only sub/ changes: the root directory's mtime stays the same
+        shutil.copy(pdf_tree / "top.pdf", pdf_tree / "sub" / "added.pdf")
+
+        assert await _list_names(pdf_tree) == ["added.pdf", "inner.pdf", "top.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_file_added_in_new_nested_directory(self, pdf_tree):
+        """A PDF in a directory created under a subdirectory shows up too"""
+        assert await _list_names(pdf_tree) == ["inner.pdf", "top.pdf"]
+
+        (pdf_tree / "sub" / "nested").mkdir()
+        shutil.copy(pdf_tree / "top.pdf", pdf_tree / "sub" / "nested" / "deep.pdf")
+
+        assert await _list_names(pdf_tree) == ["deep.pdf", "inner.pdf", "top.pdf"]
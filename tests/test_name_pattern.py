@@ -9,9 +9,13 @@ Test cases:
 5. Case insensitive matching (SAMPLE* matches sample1.pdf)
 6. No matches → empty result (not error)
 7. Complex pattern (*[0-9].pdf) → files ending with digit before .pdf
+8. Mixed-case extensions (x.Pdf, x.pDf) → listed like .pdf
+9. Directory named like a PDF (scans.pdf/) → descended, not listed
 """
 import asyncio
 import json
+import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -25,10 +29,26 @@ from src.pdf_tools import list_pdfs_handler
 SAMPLE_PDF_DIR = Path(__file__).parent.parent / "sample_pdfs"
 
 
-@pytest.fixture
-def sample_pdf_count() -> int:
-    """Count actual PDFs in sample directory"""
-    return len(list(SAMPLE_PDF_DIR.glob("*.pdf")))
+@pytest.fixture(scope="session")
+def korean_pdf() -> Path:
+    """Korean-named sample PDF, linked (or copied) from a sample once per session"""
+    target = SAMPLE_PDF_DIR / "테스트문서.pdf"
+    if not target.exists():
+        sample = next(SAMPLE_PDF_DIR.glob("sample*.pdf"), None)
+        if sample:
+            try:
+                os.link(sample, target)  # No data copy on the same filesystem
+            except OSError:
+                shutil.copy(sample, target)
+    return target
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_count(korean_pdf) -> int:
+    """Count actual PDFs in sample directory once (same suffix check as list_pdfs)"""
+    # Depends on korean_pdf so a PDF created by that fixture is already counted
+    with os.scandir(SAMPLE_PDF_DIR) as entries:
+        return sum(1 for entry in entries if entry.name[-4:].lower() == '.pdf' and entry.is_file())
 
 
 class TestNamePattern:
@@ -199,16 +219,8 @@ class TestNamePattern:
         assert "error" not in result_none
 
     @pytest.mark.asyncio
-    async def test_korean_filename_pattern(self):
+    async def test_korean_filename_pattern(self, korean_pdf):
         """Pattern with Korean characters should work"""
-        # Create Korean filename if not exists
-        korean_pdf = SAMPLE_PDF_DIR / "테스트문서.pdf"
-        if not korean_pdf.exists():
-            import shutil
-            sample = next(SAMPLE_PDF_DIR.glob("sample*.pdf"), None)
-            if sample:
-                shutil.copy(sample, korean_pdf)
-
         if korean_pdf.exists():
             # Test Korean pattern
             result_json, _ = await list_pdfs_handler({
@@ -223,9 +235,8 @@ class TestNamePattern:
             assert any("테스트" in pdf["name"] for pdf in result["pdfs"])
 
     @pytest.mark.asyncio
-    async def test_korean_exact_filename(self):
+    async def test_korean_exact_filename(self, korean_pdf):
         """Exact Korean filename should match"""
-        korean_pdf = SAMPLE_PDF_DIR / "테스트문서.pdf"
         if not korean_pdf.exists():
             pytest.skip("Korean test PDF not available")
 
@@ -239,3 +250,40 @@ class TestNamePattern:
         assert "error" not in result
         assert result["total_count"] == 1
         assert result["pdfs"][0]["name"] == "테스트문서.pdf"
+
+    @pytest.mark.asyncio
+    async def test_mixed_case_extension(self, tmp_path):
+        """.Pdf and .pDf files are PDFs too"""
+        sample = next(SAMPLE_PDF_DIR.glob("*.pdf"), None)
+        if sample is None:
+            pytest.skip("No sample PDFs available")
+        for name in ("upper.PDF", "title.Pdf", "mixed.pDf"):
+            shutil.copy(sample, tmp_path / name)
+        (tmp_path / "notes.txt").write_text("not a pdf")
+
+        result_json, _ = await list_pdfs_handler({
+            "working_directory": str(tmp_path),
+            "recursive": False
+        })
+        result = json.loads(result_json)
+
+        assert "error" not in result
+        assert sorted(pdf["name"] for pdf in result["pdfs"]) == ["mixed.pDf", "title.Pdf", "upper.PDF"]
+
+    @pytest.mark.asyncio
+    async def test_directory_named_like_pdf(self, tmp_path):
+        """A directory called scans.pdf is searched, not listed as a PDF"""
+        sample = next(SAMPLE_PDF_DIR.glob("*.pdf"), None)
+        if sample is None:
+            pytest.skip("No sample PDFs available")
+        (tmp_path / "scans.pdf").mkdir()
+        shutil.copy(sample, tmp_path / "scans.pdf" / "inside.pdf")
+
+        result_json, _ = await list_pdfs_handler({
+            "working_directory": str(tmp_path),
+            "recursive": True
+        })
+        result = json.loads(result_json)
+
+        assert "error" not in result
+        assert [pdf["name"] for pdf in result["pdfs"]] == ["inside.pdf"]
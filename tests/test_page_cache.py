@@ -0,0 +1,149 @@
+"""
+Tests for the read_pdf page cache.
+
+Test cases:
+1. Same file, pages and options → pages served from the cache
+2. File modified (mtime or size changes) → pages extracted again
+3. Different extraction options → separate cache entries
+4. Cache over page_cache_mb → least recently used pages evicted
+"""
+import json
+import os
+import shutil
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import pdf_tools
+from src.config import config
+from src.pdf_tools import read_pdf_handler
+
+
+SAMPLE_PDF_DIR = Path(__file__).parent.parent / "sample_pdfs"
+
+
+@pytest.fixture
+def pdf_copy(tmp_path, monkeypatch) -> str:
+    """Private copy of a sample PDF (read_pdf only reads below the working directory)"""
+    sample = next(SAMPLE_PDF_DIR.glob("sample*.pdf"), None)
+    if sample is None:
+        pytest.skip("No sample PDFs available")
+    shutil.copy(sample, tmp_path / "doc.pdf")
+    monkeypatch.chdir(tmp_path)
+    return "doc.pdf"
+
+
+@pytest.fixture
+def cache_puts(monkeypatch) -> list:
+    """Empty page cache; returns the keys of pages stored in it, in order"""
+    monkeypatch.setattr(pdf_tools, "_page_cache", OrderedDict())
+    monkeypatch.setattr(pdf_tools, "_page_cache_bytes", 0)
+    monkeypatch.setattr(config, "page_cache_mb", 64)
+
+    puts = []
+    original_put = pdf_tools._page_cache_put
+
+    def recording_put(key, state):
+        puts.append(key)
+        original_put(key, state)
+
+    monkeypatch.setattr(pdf_tools, "_page_cache_put", recording_put)
+    return puts
+
+
+async def _read(file_path: str, **options) -> dict:
+    result_json, _ = await read_pdf_handler({"file_path": file_path, **options})
+    result = json.loads(result_json)
+    assert "error" not in result, result
+    return result
+
+
+def _cached_pages() -> list[int]:
+    """Page numbers in the cache, least recently used first"""
+    # Key: (path, mtime_ns, size, page_num, *options)
+    return [key[3] for key in pdf_tools._page_cache]
+
+
+class TestPageCache:
+    """Tests for read_pdf page caching across calls"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_hits_cache(self, pdf_copy, cache_puts):
+        """Second identical read is served from the cache"""
+        first = await _read(pdf_copy, start_page=1, end_page=1)
+        assert len(cache_puts) == 1
+
+        second = await _read(pdf_copy, start_page=1, end_page=1)
+
+        assert len(cache_puts) == 1  # Nothing extracted (and stored) again
+        assert second["pages"] == first["pages"]
+
+    @pytest.mark.asyncio
+    async def test_mtime_change_invalidates(self, pdf_copy, cache_puts):
+        """Touching the file (new mtime, same size) re-extracts its pages"""
+        await _read(pdf_copy, start_page=1, end_page=1)
+        st = os.stat(pdf_copy)
+        os.utime(pdf_copy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        await _read(pdf_copy, start_page=1, end_page=1)
+
+        assert len(cache_puts) == 2
+        assert cache_puts[0][1] != cache_puts[1][1]  # Different mtime_ns
+
+    @pytest.mark.asyncio
+    async def test_size_change_invalidates(self, pdf_copy, cache_puts):
+        """Appending to the file (new size) re-extracts its pages"""
+        await _read(pdf_copy, start_page=1, end_page=1)
+        st = os.stat(pdf_copy)
+        with open(pdf_copy, "ab") as f:
+            f.write(b"\n% appended comment\n")  # Still a valid PDF
+        os.utime(pdf_copy, ns=(st.st_atime_ns, st.st_mtime_ns))  # Same mtime
+
+        await _read(pdf_copy, start_page=1, end_page=1)
+
+        assert len(cache_puts) == 2
+        assert cache_puts[0][2] != cache_puts[1][2]  # Different size
+
+    @pytest.mark.asyncio
+    async def test_options_are_separate_entries(self, pdf_copy, cache_puts):
+        """Reads with different extraction options don't share cache entries"""
+        await _read(pdf_copy, start_page=1, end_page=1, extraction_mode="text_only")
+        await _read(pdf_copy, start_page=1, end_page=1, extraction_mode="auto")
+        await _read(pdf_copy, start_page=1, end_page=1, extraction_mode="auto", filter_header_footer=False)
+
+        assert len(cache_puts) == 3
+        assert len(set(cache_puts)) == 3
+        assert len(pdf_tools._page_cache) == 3
+
+        # Each option set now hits its own entry
+        await _read(pdf_copy, start_page=1, end_page=1, extraction_mode="text_only")
+        assert len(cache_puts) == 3
+
+    @pytest.mark.asyncio
+    async def test_eviction_at_page_cache_mb(self, pdf_copy, cache_puts, monkeypatch):
+        """Pages beyond page_cache_mb evict the least recently used ones"""
+        first = await _read(pdf_copy, start_page=1, end_page=2, extraction_mode="image_only")
+        if len(first["pages"]) < 2:
+            pytest.skip("Sample PDF has a single page")
+        sizes = [entry[1] for entry in pdf_tools._page_cache.values()]
+        assert all(size > 0 for size in sizes)
+
+        # Room for either page on its own, but not for both
+        monkeypatch.setattr(pdf_tools, "_page_cache", OrderedDict())
+        monkeypatch.setattr(pdf_tools, "_page_cache_bytes", 0)
+        monkeypatch.setattr(config, "page_cache_mb", (sum(sizes) - 1) / (1024 * 1024))
+        cache_puts.clear()
+
+        await _read(pdf_copy, start_page=1, end_page=2, extraction_mode="image_only")
+
+        assert _cached_pages() == [2]  # Page 1 was evicted when page 2 was stored
+        assert pdf_tools._page_cache_bytes == sizes[1]
+        assert pdf_tools._page_cache_bytes <= config.page_cache_mb * 1024 * 1024
+
+        # Page 1 has to be extracted again
+        await _read(pdf_copy, start_page=1, end_page=1, extraction_mode="image_only")
+        assert [key[3] for key in cache_puts] == [1, 2, 1]
@@ -105,6 +105,18 @@ class TestReadPdfPageRange:
             from src.schemas import ReadPDFInput
             ReadPDFInput(file_path=pdf_path, start_page=5, end_page=2)
 
+    def test_end_before_start_without_suggestions(self, monkeypatch):
+        """Validator error for end < start still gives an example range with no suggestions"""
+        from src.config import config
+        from src.validators import validate_pdf_read_request
+
+        monkeypatch.setattr(config, "max_suggested_ranges", 0)
+        result = validate_pdf_read_request(get_sample_pdf(), 1, 0)
+
+        assert not result.valid
+        assert result.error == "INVALID_PAGE_RANGE"
+        assert "(e.g., 1-" in result.message
+
     @pytest.mark.asyncio
     async def test_start_page_exceeds_total(self):
         """start > total_pages → error INVALID_PAGE_RANGE"""